@@ -36,6 +36,8 @@ def main():
     parser.add_argument('--port', type=int, default=5000, help='Port to bind to (default: 5000)')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
     parser.add_argument('--scenario', help='Load initial scenario file')
+    parser.add_argument('--async-mode', choices=['eventlet', 'gevent', 'threading'],
+                        help='SocketIO worker model (default: fastest installed)')
     
     args = parser.parse_args()
     
@@ -47,7 +49,8 @@ def main():
     
     try:
         # Create Flask app and SocketIO
-        app, socketio = create_app()
+        app, socketio = create_app(async_mode=args.async_mode)
+        logger.info(f"SocketIO async mode: {socketio.async_mode}")
         
         # Load initial scenario if provided
         if args.scenario:
@@ -39,6 +39,27 @@ class TrafficSimulationController {
         this.socket.on('simulation_update', (data) => {
             this.handleSimulationUpdate(data);
         });
+
+        this.socket.on('simulation_static', (data) => {
+            // Lane geometry is sent once on connect; broadcasts omit it
+            this.staticLanes = data.lanes;
+        });
+
+        this.socket.on('simulation_snapshot', (data) => {
+            // Keep the raw server document as the patch baseline; rendering
+            // works on a shallow copy so zipping/merging never corrupts it
+            this.serverState = data;
+            this.handleSimulationUpdate({ ...data });
+        });
+
+        this.socket.on('simulation_patch', (ops) => {
+            if (!this.serverState) {
+                // No baseline yet - wait for the next snapshot
+                return;
+            }
+            this.serverState = jsonpatch.applyPatch(this.serverState, ops).newDocument;
+            this.handleSimulationUpdate({ ...this.serverState });
+        });
         
         this.socket.on('error', (error) => {
             console.error('Socket error:', error);
@@ -89,6 +110,15 @@ class TrafficSimulationController {
     }
     
     handleSimulationUpdate(data) {
+        if (data.vehicles && !Array.isArray(data.vehicles)) {
+            // Broadcasts send vehicles as parallel columns - zip into rows
+            data.vehicles = this.zipVehicleColumns(data.vehicles);
+        }
+        if (data.lanes) {
+            this.staticLanes = data.lanes;
+        } else if (this.staticLanes) {
+            data.lanes = this.staticLanes;
+        }
         this.simulationData = data;
         this.lastUpdateTime = Date.now();
         
@@ -99,6 +129,28 @@ class TrafficSimulationController {
         this.updateCharts(data);
     }
     
+    zipVehicleColumns(columns) {
+        const count = columns.id.length;
+        const rows = new Array(count);
+        for (let i = 0; i < count; i++) {
+            rows[i] = {
+                id: columns.id[i],
+                x: columns.x[i],
+                y: columns.y[i],
+                velocity: columns.velocity[i],
+                acceleration: columns.acceleration[i],
+                lane_id: columns.lane_id[i],
+                length: columns.length[i],
+                width: columns.width[i],
+                is_changing_lane: columns.is_changing_lane[i],
+                lane_change_progress: columns.lane_change_progress[i],
+                lane_change_direction: columns.lane_change_direction[i],
+                crashed: columns.crashed[i]
+            };
+        }
+        return rows;
+    }
+
     // API Communication
     async apiCall(endpoint, method = 'GET', data = null) {
         try {
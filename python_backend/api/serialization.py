@@ -0,0 +1,25 @@
+"""
+Serialization helpers for the web API
+Provides the orjson-backed JSON provider for the Flask REST routes; the
+SocketIO channel uses python-socketio's msgpack packet serializer
+(selected via SocketIO(serializer='msgpack') in web_api.create_app)
+"""
+from typing import Any
+
+import orjson
+from flask.json.provider import JSONProvider
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson
+
+    orjson encodes floats and lists several times faster than the stdlib
+    encoder, which matters for the numeric-heavy /api/status and
+    /api/vehicles responses.
+    """
+
+    def dumps(self, obj: Any, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs) -> Any:
+        return orjson.loads(s)
@@ -5,51 +5,259 @@ Flask-based REST API and WebSocket interface for controlling and monitoring the
 from flask import Flask, request, jsonify, render_template
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
+from flask_compress import Compress
+import copy
 import json
+import queue
 import threading
 import time
+from collections import deque
 from typing import Dict, Any
 
+import jsonpatch
+
 from ..core.model import TrafficSimulationModel, SimulationObserver, SimulationState
 from ..core.lane import Lane, LaneType, Coordinate
 from ..core.driver import DriverType, Route
+from . import serialization
+
+
+# Prebuilt simple 3-lane highway scenario. load_scenario only reads the
+# dict, so the same template can be reused for every request instead of
+# rebuilding ~40 literal objects per POST.
+_SIMPLE_SCENARIO = {
+    'lanes': [
+        {
+            'id': 0,
+            'type': 'NORMAL',
+            'length': 2000.0,
+            'coordinates': [{'x': 0, 'y': 0}, {'x': 2000, 'y': 0}]
+        },
+        {
+            'id': 1,
+            'type': 'NORMAL',
+            'length': 2000.0,
+            'coordinates': [{'x': 0, 'y': 4}, {'x': 2000, 'y': 4}]
+        },
+        {
+            'id': 2,
+            'type': 'NORMAL',
+            'length': 2000.0,
+            'coordinates': [{'x': 0, 'y': 8}, {'x': 2000, 'y': 8}]
+        }
+    ],
+    'connections': [
+        {'lane_id': 0, 'right': 1},
+        {'lane_id': 1, 'left': 0, 'right': 2},
+        {'lane_id': 2, 'left': 1}
+    ],
+    'routes': [
+        {'id': 1, 'lane_sequence': [0]},
+        {'id': 2, 'lane_sequence': [1]},
+        {'id': 3, 'lane_sequence': [2]}
+    ],
+    'vehicles': [
+        {'lane_id': 0, 'position': 100, 'driver_type': 'IDM', 'route_id': 1},
+        {'lane_id': 1, 'position': 150, 'driver_type': 'IDM', 'route_id': 2},
+        {'lane_id': 2, 'position': 200, 'driver_type': 'IDM', 'route_id': 3}
+    ],
+    'settings': {
+        'time_step': 0.1,
+        'real_time_factor': 1.0,
+        'debug_mode': True
+    }
+}
 
 
 class WebSocketObserver(SimulationObserver):
-    """Observer that broadcasts simulation updates via WebSocket"""
-    
-    def __init__(self, socketio: SocketIO):
+    """Observer that broadcasts simulation updates via WebSocket
+
+    Updates are not emitted one frame per tick; instead they are buffered
+    and flushed at an interval that adapts to the number of connected
+    clients. This keeps the number of WebSocket frames (and TCP writes)
+    bounded regardless of the simulation tick rate or audience size.
+
+    Each flush emits an RFC 6902 JSON Patch ('simulation_patch') computed
+    against the previously emitted state, so mostly-static data such as
+    lane geometry is not retransmitted every tick. A full
+    'simulation_snapshot' is still emitted periodically so late-joining
+    and reconnecting clients can resync.
+    """
+
+    # Upper bound on buffered ticks so a slow consumer cannot grow memory
+    MAX_BATCH_SIZE = 64
+
+    # How often to emit a full snapshot for client resync [s]
+    SNAPSHOT_INTERVAL = 1.0
+
+    # Adaptive flush interval bounds [s]: a single client gets near
+    # tick-rate updates, each extra client stretches the interval (and
+    # thereby grows the batches) so emit cost stays bounded
+    MIN_INTERVAL = 0.033
+    MAX_INTERVAL = 1.0
+    INTERVAL_PER_CLIENT = 0.02
+
+    def __init__(self, socketio: SocketIO, data_provider=None):
         self.socketio = socketio
-        self.last_broadcast_time = 0.0
-        self.broadcast_interval = 0.1  # Broadcast every 100ms
-    
+        # Callable returning the current simulation data dict; lets the
+        # observer share a per-tick cache with the REST routes
+        self.data_provider = data_provider
+        self.client_count = 0
+        self._buffer = deque(maxlen=self.MAX_BATCH_SIZE)
+        self._buffer_lock = threading.Lock()
+        self._flusher_running = False
+        self._last_snapshot = None
+        self._last_snapshot_time = 0.0
+        # Single-slot handoff to the emitter task: if the socket is
+        # backpressured, a newer frame overwrites the stale one instead
+        # of queueing behind it, keeping memory O(1) per observer
+        self._pending = queue.Queue(maxsize=1)
+
     def simulation_updated(self, model: TrafficSimulationModel):
-        """Send simulation data to connected clients"""
-        current_time = time.time()
-        if current_time - self.last_broadcast_time >= self.broadcast_interval:
+        """Buffer simulation data for the next batched broadcast"""
+        if self.data_provider is not None:
+            data = self.data_provider()
+        else:
             data = model.get_simulation_data()
-            self.socketio.emit('simulation_update', data)
-            self.last_broadcast_time = current_time
+        with self._buffer_lock:
+            self._buffer.append(data)
+            if not self._flusher_running:
+                self._flusher_running = True
+                self.socketio.start_background_task(self._flush_loop)
+                self.socketio.start_background_task(self._emit_loop)
+
+    def client_connected(self):
+        """Track a new client for interval scaling"""
+        self.client_count += 1
+
+    def client_disconnected(self):
+        """Track a departing client for interval scaling"""
+        self.client_count = max(0, self.client_count - 1)
+
+    def _current_interval(self) -> float:
+        """Flush interval scaled by the number of connected clients"""
+        scaled = self.INTERVAL_PER_CLIENT * self.client_count
+        return min(self.MAX_INTERVAL, max(self.MIN_INTERVAL, scaled))
+
+    def _flush_loop(self):
+        """Background task that drains the buffer and emits one patch frame"""
+        while True:
+            self.socketio.sleep(self._current_interval())
+            with self._buffer_lock:
+                if not self._buffer:
+                    continue
+                batch = list(self._buffer)
+                self._buffer.clear()
+            self._emit_batch(batch)
+
+    def _emit_batch(self, batch):
+        """Emit buffered updates as a delta, with periodic full snapshots"""
+        now = time.time()
+        latest = batch[-1]
+
+        if (self._last_snapshot is None or
+                now - self._last_snapshot_time >= self.SNAPSHOT_INTERVAL):
+            self._publish('simulation_snapshot', latest, latest)
+            self._last_snapshot_time = now
+        else:
+            # Concatenate the per-tick patches so one frame covers the batch
+            ops = []
+            previous = self._last_snapshot
+            for data in batch:
+                ops.extend(jsonpatch.make_patch(previous, data).patch)
+                previous = data
+            self._publish('simulation_patch', ops, latest)
+
+        self._last_snapshot = copy.deepcopy(latest)
+
+    def _publish(self, event, payload, snapshot):
+        """Hand a frame to the emitter with newest-wins drop semantics
+
+        If the previous frame is still pending (slow consumer), it is
+        dropped and replaced. The replacement is always a full snapshot:
+        dropping a patch frame would break the client-side patch chain.
+        """
+        try:
+            self._pending.put_nowait((event, payload))
+        except queue.Full:
+            try:
+                self._pending.get_nowait()
+            except queue.Empty:
+                pass
+            self._pending.put_nowait(('simulation_snapshot', snapshot))
+
+    def _emit_loop(self):
+        """Background task that emits the freshest pending frame"""
+        while True:
+            try:
+                event, payload = self._pending.get_nowait()
+            except queue.Empty:
+                self.socketio.sleep(0.01)
+                continue
+            self.socketio.emit(event, payload)
+
 
+def create_app(async_mode=None):
+    """Create and configure Flask application
 
-def create_app():
-    """Create and configure Flask application"""
-    app = Flask(__name__, 
+    async_mode selects the Flask-SocketIO worker model ('eventlet',
+    'gevent' or 'threading'). The default of None picks the fastest
+    server installed (eventlet, then gevent) instead of falling back to
+    Werkzeug's development server.
+    """
+    app = Flask(__name__,
                 template_folder='../../frontend/templates',
                 static_folder='../../frontend/static')
     app.config['SECRET_KEY'] = 'traffic_sim_secret_key'
-    
+
+    # Use orjson for the REST routes - much faster for numeric payloads
+    app.json = serialization.OrjsonProvider(app)
+
     # Enable CORS for all routes
     CORS(app)
-    
-    # Initialize SocketIO
-    socketio = SocketIO(app, cors_allowed_origins="*")
+
+    # Gzip the REST responses - snapshot JSON grows linearly with vehicle
+    # count and compresses ~5x
+    Compress(app)
+
+    # Initialize SocketIO with msgpack binary packet framing instead of
+    # JSON text (pairs with the socket.io.msgpack client build loaded by
+    # the frontend), and compress Engine.IO polling payloads; per-message
+    # deflate on upgraded WebSocket connections is negotiated by the
+    # transport
+    socketio = SocketIO(app, cors_allowed_origins="*", serializer='msgpack',
+                        async_mode=async_mode,
+                        http_compression=True, compression_threshold=1024)
     
     # Get simulation model instance
     model = TrafficSimulationModel.get_instance()
-    
-    # Create WebSocket observer
-    ws_observer = WebSocketObserver(socketio)
+
+    # Per-tick snapshot cache shared by the observer and the REST routes.
+    # A burst of clients on the same tick would otherwise each rebuild the
+    # identical simulation data dict.
+    data_cache = {'key': None, 'data': None}
+
+    def get_cached_simulation_data():
+        """Return the simulation data dict, rebuilt at most once per tick"""
+        key = (id(model), model.tick_count)
+        if data_cache['key'] != key:
+            data_cache['data'] = model.get_simulation_data()
+            data_cache['key'] = key
+        return data_cache['data']
+
+    dynamic_cache = {'key': None, 'data': None}
+
+    def get_cached_dynamic_data():
+        """Like get_cached_simulation_data but without the static lanes"""
+        key = (id(model), model.tick_count)
+        if dynamic_cache['key'] != key:
+            dynamic_cache['data'] = model.get_simulation_data(dynamic_only=True)
+            dynamic_cache['key'] = key
+        return dynamic_cache['data']
+
+    # Create WebSocket observer; broadcasts carry only the dynamic data,
+    # clients receive the static scenario once on connect
+    ws_observer = WebSocketObserver(socketio, data_provider=get_cached_dynamic_data)
     model.add_observer(ws_observer)
     
     # Web routes
@@ -61,7 +269,7 @@ def create_app():
     @app.route('/api/status', methods=['GET'])
     def get_status():
         """Get current simulation status"""
-        return jsonify(model.get_simulation_data())
+        return jsonify(get_cached_simulation_data())
     
     @app.route('/api/start', methods=['POST'])
     def start_simulation():
@@ -112,22 +320,28 @@ def create_app():
     def reset_simulation():
         """Reset the simulation"""
         try:
-            model.stop_simulation()
-            TrafficSimulationModel.reset_instance()
-            # Reinitialize
-            global model, ws_observer
-            model = TrafficSimulationModel.get_instance()
-            ws_observer = WebSocketObserver(socketio)
-            model.add_observer(ws_observer)
+            # In-place reset keeps the singleton model and its observer
+            # wiring; no Flask/SocketIO objects are recreated
+            model.clear()
             return jsonify({'status': 'success', 'message': 'Simulation reset'})
         except Exception as e:
             return jsonify({'status': 'error', 'message': str(e)}), 500
     
     @app.route('/api/vehicles', methods=['GET'])
     def get_vehicles():
-        """Get all vehicles"""
-        vehicles = [vehicle.to_dict() for vehicle in model.get_vehicles()]
-        return jsonify({'vehicles': vehicles})
+        """Get all vehicles as parallel columns (see get_vehicle_columns)
+
+        ?fields=id,x,y projects just those columns.
+        """
+        fields = request.args.get('fields')
+        if fields:
+            try:
+                return jsonify({'vehicles': model.get_vehicle_columns(
+                    tuple(fields.split(',')))})
+            except KeyError as e:
+                return jsonify({'status': 'error',
+                                'message': f'Unknown field: {e.args[0]}'}), 400
+        return jsonify({'vehicles': model.get_vehicle_columns()})
     
     @app.route('/api/vehicles', methods=['POST'])
     def add_vehicle():
@@ -135,7 +349,7 @@ def create_app():
         try:
             data = request.get_json()
             lane_id = data.get('lane_id')
-            driver_type = data.get('driver_type', DriverType.IDM)
+            driver_type = DriverType.coerce(data.get('driver_type', DriverType.IDM))
             position = data.get('position', 0.0)
             
             # Create route if provided
@@ -154,10 +368,13 @@ def create_app():
                 })
             else:
                 return jsonify({'status': 'error', 'message': 'Failed to add vehicle'}), 400
-                
+
+        except ValueError as e:
+            # Bad driver_type or malformed payload - the client's fault
+            return jsonify({'status': 'error', 'message': str(e)}), 400
         except Exception as e:
             return jsonify({'status': 'error', 'message': str(e)}), 500
-    
+
     @app.route('/api/vehicles/<int:vehicle_id>', methods=['DELETE'])
     def remove_vehicle(vehicle_id: int):
         """Remove a vehicle"""
@@ -213,51 +430,7 @@ def create_app():
     def load_simple_scenario():
         """Load a simple test scenario"""
         try:
-            # Create a simple 3-lane highway scenario
-            scenario = {
-                'lanes': [
-                    {
-                        'id': 0,
-                        'type': 'NORMAL',
-                        'length': 2000.0,
-                        'coordinates': [{'x': 0, 'y': 0}, {'x': 2000, 'y': 0}]
-                    },
-                    {
-                        'id': 1,
-                        'type': 'NORMAL',
-                        'length': 2000.0,
-                        'coordinates': [{'x': 0, 'y': 4}, {'x': 2000, 'y': 4}]
-                    },
-                    {
-                        'id': 2,
-                        'type': 'NORMAL',
-                        'length': 2000.0,
-                        'coordinates': [{'x': 0, 'y': 8}, {'x': 2000, 'y': 8}]
-                    }
-                ],
-                'connections': [
-                    {'lane_id': 0, 'right': 1},
-                    {'lane_id': 1, 'left': 0, 'right': 2},
-                    {'lane_id': 2, 'left': 1}
-                ],
-                'routes': [
-                    {'id': 1, 'lane_sequence': [0]},
-                    {'id': 2, 'lane_sequence': [1]},
-                    {'id': 3, 'lane_sequence': [2]}
-                ],
-                'vehicles': [
-                    {'lane_id': 0, 'position': 100, 'driver_type': 'IDM', 'route_id': 1},
-                    {'lane_id': 1, 'position': 150, 'driver_type': 'IDM', 'route_id': 2},
-                    {'lane_id': 2, 'position': 200, 'driver_type': 'IDM', 'route_id': 3}
-                ],
-                'settings': {
-                    'time_step': 0.1,
-                    'real_time_factor': 1.0,
-                    'debug_mode': True
-                }
-            }
-            
-            model.load_scenario(scenario)
+            model.load_scenario(_SIMPLE_SCENARIO)
             return jsonify({'status': 'success', 'message': 'Simple scenario loaded'})
             
         except Exception as e:
@@ -293,18 +466,21 @@ def create_app():
     def handle_connect():
         """Handle client connection"""
         print('Client connected')
-        # Send current simulation state
-        emit('simulation_update', model.get_simulation_data())
+        ws_observer.client_connected()
+        # Send the cached static scenario once, then the current state
+        emit('simulation_static', model.get_static_data())
+        emit('simulation_update', get_cached_simulation_data())
     
     @socketio.on('disconnect')
     def handle_disconnect():
         """Handle client disconnection"""
         print('Client disconnected')
+        ws_observer.client_disconnected()
     
     @socketio.on('request_update')
     def handle_request_update():
         """Handle client request for current simulation state"""
-        emit('simulation_update', model.get_simulation_data())
+        emit('simulation_update', get_cached_simulation_data())
     
     return app, socketio
 
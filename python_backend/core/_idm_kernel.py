@@ -0,0 +1,129 @@
+"""
+Numba-compiled IDM inner kernel
+numba is an optional accelerator on top of the NumPy path: when it is
+installed the per-vehicle IDM loop runs as compiled, parallel LLVM code;
+without it kernels.py keeps using the vectorized NumPy expressions
+"""
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - numba not installed
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+# Sentinel leader velocity marking a free-flowing vehicle (no leader)
+NO_LEADER = -1.0
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def idm_step(v, x, v_lead, x_lead, leader_length, v0, T, s0, a_max, b, out):
+    """Scalar IDM loop over flat float64 arrays, compiled with numba
+
+    The net gap is derived inside the kernel from the follower/leader
+    positions and leader length, so the Python gather loop only copies
+    raw state. Entries with v_lead == NO_LEADER take the free-flow
+    branch. Results are written into the preallocated out array.
+    cache=True avoids the first-call compile latency on subsequent
+    processes.
+
+    Serial nogil rather than parallel prange: the kernel is called from
+    the simulation thread, and numba's default workqueue threading layer
+    can hang interpreter shutdown when its runtime is started off the
+    main thread. nogil still lets other threads (the web server) run
+    during the compiled loop.
+    """
+    for i in range(len(v)):
+        ratio = v[i] / v0[i]
+        ratio2 = ratio * ratio
+        free_flow_term = ratio2 * ratio2  # (v / v0)^4
+
+        if v_lead[i] == NO_LEADER:
+            acceleration = a_max[i] * (1.0 - free_flow_term)
+        else:
+            gap = x_lead[i] - x[i] - leader_length[i]
+            desired_gap = (s0[i] + T[i] * v[i] +
+                           v[i] * (v[i] - v_lead[i]) /
+                           (2.0 * (a_max[i] * b[i]) ** 0.5))
+            safe_gap = gap if gap > 1e-6 else 1e-6
+            interaction = desired_gap / safe_gap
+            acceleration = a_max[i] * (1.0 - free_flow_term -
+                                       interaction * interaction)
+
+        out[i] = acceleration if acceleration > -b[i] else -b[i]
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def kinematics_step(x, y, v, a, dy, progress, crashed, dt, finished):
+    """Scalar kinematic integration loop, compiled with numba
+
+    Same semantics as the vectorized kernels.step_kinematics: advance
+    lane-change progress, apply the clamped longitudinal update, drift
+    laterally while mid-change, skip crashed rows. Rows whose progress
+    crossed 1.0 this step are flagged in the preallocated finished
+    array for Python-side end_lane_change handling.
+
+    Serial nogil rather than parallel prange for the same reason as
+    idm_step above.
+    """
+    half_dt2 = 0.5 * dt * dt
+    for i in range(len(x)):
+        finished[i] = False
+        if crashed[i]:
+            continue
+
+        changing = dy[i] != 0.0
+        if changing:
+            progress[i] += dy[i] * dt
+            if progress[i] >= 1.0:
+                finished[i] = True
+
+        dx = dt * v[i] + half_dt2 * a[i]
+        if dx < 0.0:
+            dx = 0.0
+        v[i] += dt * a[i]
+        if v[i] < 0.0:
+            v[i] = 0.0
+        x[i] += dx
+        if changing and not finished[i]:
+            y[i] += dy[i] * dt
+
+
+def make_kinematics_kernel(dt):
+    """Compile a kinematics kernel with dt burned in as a constant
+
+    Most runs use one fixed time step, so dt and 0.5*dt*dt are closed
+    over and constant-folded by LLVM instead of being passed (and
+    re-derived) per call. Closures cannot use cache=True, so the
+    compile cost is paid once per process per dt value - callers
+    memoize the result (see kernels.make_step_kernel).
+    """
+    half_dt2 = 0.5 * dt * dt
+
+    @njit(fastmath=True, nogil=True)
+    def kernel(x, y, v, a, dy, progress, crashed, finished):
+        for i in range(len(x)):
+            finished[i] = False
+            if crashed[i]:
+                continue
+
+            changing = dy[i] != 0.0
+            if changing:
+                progress[i] += dy[i] * dt
+                if progress[i] >= 1.0:
+                    finished[i] = True
+
+            dx = dt * v[i] + half_dt2 * a[i]
+            if dx < 0.0:
+                dx = 0.0
+            v[i] += dt * a[i]
+            if v[i] < 0.0:
+                v[i] = 0.0
+            x[i] += dx
+            if changing and not finished[i]:
+                y[i] += dy[i] * dt
+
+    return kernel
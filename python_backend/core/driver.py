@@ -2,85 +2,133 @@
 Driver module - Python equivalent of Java Driver classes
 Implements vehicle control logic and driving behavior models
 """
-from typing import Optional, Dict, Any, List
-from abc import ABC, abstractmethod
+from typing import Optional, Dict, Any, List, Protocol
 from enum import Enum
 import math
 import random
 
+from .vehicle import Enclosure, LatDirection
+
 
 class DriverType(Enum):
-    """Types of drivers with different behaviors"""
+    """Types of drivers with different behaviors
+
+    Values stay strings because scenarios and the REST API exchange them
+    as names ('IDM', 'AGGRESSIVE', ...); coerce() additionally accepts
+    raw integer indices so clients can skip the string round-trip.
+    """
     AGGRESSIVE = "AGGRESSIVE"
     NORMAL = "NORMAL"
     CAUTIOUS = "CAUTIOUS"
     IDM = "IDM"  # Intelligent Driver Model
 
+    @classmethod
+    def coerce(cls, value) -> 'DriverType':
+        """Convert an enum member, string value, or integer index
+
+        Raises ValueError for unknown values, including out-of-range
+        indices, so API callers can report a client error.
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, int):
+            if 0 <= value < len(_DRIVER_TYPES_BY_INDEX):
+                return _DRIVER_TYPES_BY_INDEX[value]
+            raise ValueError(f"{value} is not a valid {cls.__name__} index")
+        return cls(value)
+
+
+_DRIVER_TYPES_BY_INDEX = tuple(DriverType)
+
+# Per-type IDM parameters: (time_headway, min_spacing, max_acceleration,
+# comfortable_deceleration, politeness, desired_speed_factor). A table
+# lookup on init replaces the old if/elif chain.
+_PARAM_TABLE = {
+    DriverType.AGGRESSIVE: (1.0, 1.5, 2.5, 4.0, 0.2, 1.1),
+    DriverType.NORMAL: (1.5, 2.0, 2.0, 3.0, 0.5, 1.0),
+    DriverType.CAUTIOUS: (2.5, 3.0, 1.5, 2.0, 0.8, 0.9),
+    DriverType.IDM: (1.5, 2.0, 2.0, 3.0, 0.5, 1.0),
+}
+
 
 class Route:
     """Represents a route through the network"""
-    
+
+    __slots__ = ('id', 'lane_sequence', 'current_index', '_len')
+
     def __init__(self, route_id: int, lane_sequence: List[int]):
         self.id = route_id
-        self.lane_sequence = lane_sequence  # List of lane IDs to follow
+        # Lane IDs to follow; immutable after construction, so store it
+        # as a tuple and precompute the length used on every query
+        self.lane_sequence = tuple(lane_sequence)
         self.current_index = 0
-    
+        self._len = len(self.lane_sequence)
+
     def get_current_target_lane(self) -> Optional[int]:
         """Get current target lane ID"""
-        if self.current_index < len(self.lane_sequence):
+        if self.current_index < self._len:
             return self.lane_sequence[self.current_index]
         return None
-    
+
     def advance_route(self):
         """Move to next lane in route"""
-        if self.current_index < len(self.lane_sequence) - 1:
+        if self.current_index < self._len - 1:
             self.current_index += 1
-    
+
     def is_route_complete(self) -> bool:
         """Check if route is completed"""
-        return self.current_index >= len(self.lane_sequence)
+        return self.current_index >= self._len
 
 
-class DriverInterface(ABC):
-    """Abstract interface for drivers - Python equivalent of jDriver"""
-    
-    @abstractmethod
+class DriverInterface(Protocol):
+    """Driver interface - Python equivalent of jDriver
+
+    A typing.Protocol rather than an ABC: drive() is called once per
+    vehicle per tick, and plain classes avoid the abstract-method and
+    metaclass machinery on every dispatch. Concrete drivers satisfy the
+    protocol structurally instead of inheriting from it.
+    """
+
     def get_id(self) -> int:
         """Get driver ID"""
-        pass
-    
-    @abstractmethod
+        ...
+
     def drive(self):
         """Execute driving behavior for current time step"""
-        pass
-    
-    @abstractmethod
+        ...
+
     def get_route(self) -> Optional[Route]:
         """Get driver's route"""
-        pass
-    
-    @abstractmethod
+        ...
+
     def set_route(self, route: Route):
         """Set driver's route"""
-        pass
-    
-    @abstractmethod
+        ...
+
     def set_vehicle(self, vehicle: 'Vehicle'):
         """Set vehicle controlled by this driver"""
-        pass
-    
-    @abstractmethod
+        ...
+
     def get_vehicle(self) -> Optional['Vehicle']:
         """Get vehicle controlled by this driver"""
-        pass
+        ...
 
 
-class IDMDriver(DriverInterface):
+class IDMDriver:
     """
     Intelligent Driver Model (IDM) implementation
     Based on the car-following model by Treiber et al.
     """
-    
+
+    # One instance per vehicle, so replace the per-instance dict with a
+    # compact slot layout - less memory and faster attribute access in
+    # the per-tick hot loop
+    __slots__ = ('id', 'type', 'vehicle', 'route', 'desired_speed',
+                 'time_headway', 'min_spacing', 'max_acceleration',
+                 'comfortable_deceleration', 'acceleration_exponent',
+                 'politeness', 'lane_change_threshold', 'min_lane_change_gap',
+                 '_two_sqrt_ab', '_inv_desired_speed')
+
     def __init__(self, driver_id: int, driver_type: DriverType = DriverType.IDM):
         self.id = driver_id
         self.type = driver_type
@@ -105,24 +153,17 @@ class IDMDriver(DriverInterface):
     
     def _adjust_parameters_for_type(self):
         """Adjust driving parameters based on driver type"""
-        if self.type == DriverType.AGGRESSIVE:
-            self.time_headway = 1.0
-            self.min_spacing = 1.5
-            self.max_acceleration = 2.5
-            self.comfortable_deceleration = 4.0
-            self.politeness = 0.2
-            self.desired_speed *= 1.1
-        elif self.type == DriverType.CAUTIOUS:
-            self.time_headway = 2.5
-            self.min_spacing = 3.0
-            self.max_acceleration = 1.5
-            self.comfortable_deceleration = 2.0
-            self.politeness = 0.8
-            self.desired_speed *= 0.9
-        elif self.type == DriverType.NORMAL:
-            # Use default parameters
-            pass
-    
+        (self.time_headway, self.min_spacing, self.max_acceleration,
+         self.comfortable_deceleration, self.politeness,
+         speed_factor) = _PARAM_TABLE[self.type]
+        self.desired_speed *= speed_factor
+
+        # Precompute hot-loop constants - these only change when the
+        # driver parameters above change
+        self._two_sqrt_ab = 2.0 * math.sqrt(self.max_acceleration *
+                                            self.comfortable_deceleration)
+        self._inv_desired_speed = 1.0 / self.desired_speed
+
     def get_id(self) -> int:
         return self.id
     
@@ -143,48 +184,76 @@ class IDMDriver(DriverInterface):
         """Execute driving behavior for current time step"""
         if not self.vehicle or self.vehicle.state.crashed:
             return
-        
+
         # Car following behavior
         acceleration = self._calculate_acceleration()
         self.vehicle.set_acceleration(acceleration)
-        
+
         # Lane changing behavior
         self._consider_lane_change()
-    
+
+    def apply_acceleration(self, acceleration: float):
+        """Apply an acceleration computed by the model's batched IDM pass
+
+        Used instead of drive() when the model has already evaluated the
+        car-following formula for all vehicles at once; only the lane
+        change decision remains per-driver.
+        """
+        if not self.vehicle or self.vehicle.state.crashed:
+            return
+
+        self.vehicle.set_acceleration(acceleration)
+        self._consider_lane_change()
+
+    def _idm_acc(self, v: float, v_lead: float, gap: float) -> float:
+        """Clamped IDM acceleration for speed v behind a leader
+
+        The single hot-path formula shared by car following and the MOBIL
+        evaluation, so the two can never drift apart. The tiny gap floor
+        replaces a gap > 0 branch - a vanishing gap still clamps to full
+        comfortable braking.
+        """
+        ratio = v * self._inv_desired_speed
+        if self.acceleration_exponent == 4:
+            # Every stock driver profile uses delta=4; explicit multiplies
+            # beat the generic ** dispatch by ~5x
+            ratio2 = ratio * ratio
+            free_flow_term = ratio2 * ratio2  # (v / v0)^4
+        else:
+            free_flow_term = ratio ** self.acceleration_exponent
+
+        desired_gap = (self.min_spacing +
+                       self.time_headway * v +
+                       (v * (v - v_lead)) / self._two_sqrt_ab)
+        safe_gap = gap if gap > 1e-6 else 1e-6
+        interaction = desired_gap / safe_gap
+        acceleration = self.max_acceleration * (1 - free_flow_term -
+                                                interaction * interaction)
+
+        deceleration_limit = -self.comfortable_deceleration
+        return acceleration if acceleration > deceleration_limit else deceleration_limit
+
     def _calculate_acceleration(self) -> float:
         """Calculate acceleration using IDM formula"""
         if not self.vehicle:
             return 0.0
-        
+
         v = self.vehicle.get_velocity()
-        leader = self.vehicle.get_vehicle(self.vehicle.surrounding['FRONT'] 
-                                         if 'FRONT' in self.vehicle.surrounding else None)
-        
-        # Free flow acceleration
-        free_acceleration = self.max_acceleration * (
-            1 - (v / self.desired_speed) ** self.acceleration_exponent
-        )
-        
+        # O(1) read of the per-tick leader link maintained by the lane
+        leader = self.vehicle.get_vehicle(Enclosure.FRONT)
+
         if leader is None:
             # No leader, use free flow acceleration
-            return free_acceleration
-        
-        # Calculate desired gap
-        gap = self.vehicle.get_gap(leader)
-        leader_velocity = leader.get_velocity()
-        velocity_diff = v - leader_velocity
-        
-        desired_gap = (self.min_spacing + 
-                      self.time_headway * v + 
-                      (v * velocity_diff) / (2 * math.sqrt(self.max_acceleration * 
-                                                         self.comfortable_deceleration)))
-        
-        # IDM acceleration formula
-        interaction_term = (desired_gap / gap) ** 2 if gap > 0 else float('inf')
-        acceleration = self.max_acceleration * (1 - (v / self.desired_speed) ** self.acceleration_exponent - 
-                                              interaction_term)
-        
-        return max(acceleration, -self.comfortable_deceleration)
+            ratio = v * self._inv_desired_speed
+            if self.acceleration_exponent == 4:
+                # Same delta=4 fast path as _idm_acc
+                ratio2 = ratio * ratio
+                free_flow_term = ratio2 * ratio2  # (v / v0)^4
+            else:
+                free_flow_term = ratio ** self.acceleration_exponent
+            return self.max_acceleration * (1 - free_flow_term)
+
+        return self._idm_acc(v, leader.get_velocity(), self.vehicle.get_gap(leader))
     
     def _consider_lane_change(self):
         """Evaluate and execute lane changes using MOBIL model"""
@@ -192,33 +261,38 @@ class IDMDriver(DriverInterface):
             return
         
         lane = self.vehicle.get_lane()
-        
-        # Consider left lane change
-        if lane.get_left_lane() and self._should_change_lane(lane.get_left_lane()):
-            if lane.is_safe_lane_change(self.vehicle, lane.get_left_lane()):
-                from .vehicle import LatDirection
+
+        # The lateral leaders were already resolved by the per-tick
+        # surroundings pass; reuse those links instead of re-searching
+        # the target lanes
+        left_lane = lane.get_left_lane()
+        if left_lane and self._should_change_lane(
+                self.vehicle.get_vehicle(Enclosure.LEFT_FRONT)):
+            if lane.is_safe_lane_change(self.vehicle, left_lane):
                 self.vehicle.start_lane_change(LatDirection.LEFT)
                 return
-        
-        # Consider right lane change
-        if lane.get_right_lane() and self._should_change_lane(lane.get_right_lane()):
-            if lane.is_safe_lane_change(self.vehicle, lane.get_right_lane()):
-                from .vehicle import LatDirection
+
+        right_lane = lane.get_right_lane()
+        if right_lane and self._should_change_lane(
+                self.vehicle.get_vehicle(Enclosure.RIGHT_FRONT)):
+            if lane.is_safe_lane_change(self.vehicle, right_lane):
                 self.vehicle.start_lane_change(LatDirection.RIGHT)
                 return
-    
-    def _should_change_lane(self, target_lane: 'Lane') -> bool:
-        """Determine if lane change is beneficial using MOBIL criteria"""
+
+    def _should_change_lane(self, target_leader: Optional['Vehicle']) -> bool:
+        """Determine if lane change is beneficial using MOBIL criteria
+
+        target_leader is the would-be leader in the target lane, as
+        maintained in Vehicle.surrounding by the per-tick pass.
+        """
         if not self.vehicle:
             return False
-        
+
         # Calculate current acceleration
         current_accel = self._calculate_acceleration()
-        
+
         # Calculate acceleration in target lane (simplified)
         # This would need more sophisticated implementation for full MOBIL
-        target_leader = target_lane.get_leading_vehicle(self.vehicle.get_x())
-        
         if target_leader is None:
             target_accel = self.max_acceleration
         else:
@@ -226,19 +300,9 @@ class IDMDriver(DriverInterface):
             gap = target_leader.get_x() - self.vehicle.get_x() - self.vehicle.length
             if gap <= 0:
                 return False
-            
-            v = self.vehicle.get_velocity()
-            leader_velocity = target_leader.get_velocity()
-            velocity_diff = v - leader_velocity
-            
-            desired_gap = (self.min_spacing + 
-                          self.time_headway * v + 
-                          (v * velocity_diff) / (2 * math.sqrt(self.max_acceleration * 
-                                                             self.comfortable_deceleration)))
-            
-            interaction_term = (desired_gap / gap) ** 2 if gap > 0 else float('inf')
-            target_accel = self.max_acceleration * (1 - (v / self.desired_speed) ** self.acceleration_exponent - 
-                                                  interaction_term)
+
+            target_accel = self._idm_acc(self.vehicle.get_velocity(),
+                                         target_leader.get_velocity(), gap)
         
         # Lane change if target acceleration is significantly better
         advantage = target_accel - current_accel
@@ -278,9 +342,12 @@ class IDMDriver(DriverInterface):
         return self.__str__()
 
 
-class SimpleDriver(DriverInterface):
+class SimpleDriver:
     """Simple driver implementation for testing"""
-    
+
+    __slots__ = ('id', 'type', 'vehicle', 'route', 'desired_speed',
+                 'reaction_time', 'max_acceleration', 'max_deceleration')
+
     def __init__(self, driver_id: int, driver_type: DriverType = DriverType.NORMAL):
         self.id = driver_id
         self.type = driver_type
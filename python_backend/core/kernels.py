@@ -0,0 +1,110 @@
+"""
+Vectorized kernels for the per-tick hot loops
+NumPy is an optional accelerator: the pure-Python core keeps working
+without it and the model falls back to the per-object scalar path, so
+simple_server.py still runs without external dependencies
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy not installed
+    np = None
+
+from . import _idm_kernel
+from ._idm_kernel import NO_LEADER
+
+HAVE_NUMPY = np is not None
+
+
+def idm_accelerations(v, x, v_lead, x_lead, leader_length, v0, T, s0, a_max, b):
+    """Compute IDM accelerations for all vehicles in one vectorized step
+
+    All arguments are parallel float64 arrays (struct-of-arrays layout);
+    the net gap is derived from the position/length columns inside the
+    kernel. Entries with v_lead == NO_LEADER are treated as free flow.
+    Returns the acceleration array clamped at -b.
+
+    When numba is installed the compiled parallel kernel is used; the
+    NumPy expressions below are the fallback.
+    """
+    if _idm_kernel.HAVE_NUMBA:
+        out = np.empty_like(v)
+        _idm_kernel.idm_step(v, x, v_lead, x_lead, leader_length,
+                             v0, T, s0, a_max, b, out)
+        return out
+
+    ratio2 = np.square(v / v0)
+    free_flow_term = np.square(ratio2)  # (v / v0)^4
+
+    gap = x_lead - x - leader_length
+    desired_gap = s0 + T * v + v * (v - v_lead) / (2.0 * np.sqrt(a_max * b))
+    safe_gap = np.maximum(gap, 1e-6)
+    interaction_term = np.square(desired_gap / safe_gap)
+    interaction_term = np.where(v_lead == NO_LEADER, 0.0, interaction_term)
+
+    acceleration = a_max * (1.0 - free_flow_term - interaction_term)
+    return np.maximum(acceleration, -b)
+
+
+# Specialized kinematics kernels memoized per dt value
+_STEP_KERNELS: dict = {}
+
+
+def make_step_kernel(dt):
+    """Return a step_kinematics equivalent specialized for a fixed dt
+
+    The returned callable takes the seven column arrays and returns the
+    finished-lane-change mask. With numba installed, dt and 0.5*dt*dt
+    are burned into the compiled kernel as constants; kernels are cached
+    per dt, so the compile happens once per new time step value.
+    """
+    kernel = _STEP_KERNELS.get(dt)
+    if kernel is not None:
+        return kernel
+
+    if _idm_kernel.HAVE_NUMBA:
+        inner = _idm_kernel.make_kinematics_kernel(dt)
+
+        def kernel(x, y, v, a, dy, progress, crashed):
+            finished = np.empty(len(x), dtype=bool)
+            inner(x, y, v, a, dy, progress, crashed, finished)
+            return finished
+    else:
+        def kernel(x, y, v, a, dy, progress, crashed):
+            return step_kinematics(x, y, v, a, dy, progress, crashed, dt)
+
+    _STEP_KERNELS[dt] = kernel
+    return kernel
+
+
+def step_kinematics(x, y, v, a, dy, progress, crashed, dt):
+    """Integrate one kinematic step over all vehicles, in place
+
+    Mirrors Vehicle.move: lane-change progress advances first, then the
+    clamped longitudinal update, then the lateral drift for vehicles
+    still mid-change. Crashed rows are left untouched. Returns the
+    boolean mask of rows whose lane change completed this step
+    (progress crossed 1.0); the caller resolves those through
+    Vehicle.end_lane_change, which needs lane membership.
+
+    When numba is installed the compiled kernel is used; the NumPy
+    expressions below are the fallback.
+    """
+    if _idm_kernel.HAVE_NUMBA:
+        finished = np.empty(len(x), dtype=bool)
+        _idm_kernel.kinematics_step(x, y, v, a, dy, progress, crashed,
+                                    dt, finished)
+        return finished
+
+    active = ~crashed
+    changing = active & (dy != 0.0)
+
+    np.add(progress, dy * dt, out=progress, where=changing)
+    finished = changing & (progress >= 1.0)
+
+    dx = dt * v + (0.5 * dt * dt) * a
+    np.maximum(dx, 0.0, out=dx)
+    np.add(v, dt * a, out=v, where=active)
+    np.maximum(v, 0.0, out=v)
+    np.add(x, dx, out=x, where=active)
+    np.add(y, dy * dt, out=y, where=changing & ~finished)
+    return finished
@@ -5,6 +5,8 @@ Manages a single lane of traffic and vehicle interactions
 from typing import List, Optional, Dict, Tuple, Any
 from enum import Enum
 import math
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
 from dataclasses import dataclass
 
 
@@ -17,13 +19,30 @@ class LaneType(Enum):
     ENTRANCE = "ENTRANCE"
 
 
-@dataclass
+@dataclass(slots=True)
 class Coordinate:
     """2D coordinate point"""
     x: float
     y: float
 
 
+def _vehicle_x(vehicle: 'Vehicle') -> float:
+    """Sort/search key for vehicles ordered by longitudinal position"""
+    return vehicle.state.x
+
+
+# Cell size [m] of the model-level spatial grid; ~a few car-following
+# distances, so neighbors are nearly always within one cell
+GRID_CELL = 50.0
+
+
+# Result of Lane.get_neighbors; a namedtuple is allocated in one step and
+# always carries all six slots, unlike the dict it replaced
+Neighbors = namedtuple('Neighbors',
+                       'leader follower left_leader left_follower '
+                       'right_leader right_follower')
+
+
 class Lane:
     """Main lane implementation - Python equivalent of Java jLane class"""
     
@@ -42,7 +61,8 @@ class Lane:
                 Coordinate(0.0, 0.0),
                 Coordinate(length, 0.0)
             ]
-        
+        self._update_geometry()
+
         # Lane connections
         self.upstream_lane: Optional['Lane'] = None
         self.downstream_lane: Optional['Lane'] = None
@@ -50,109 +70,225 @@ class Lane:
         self.right_lane: Optional['Lane'] = None
         self.taper_lane: Optional['Lane'] = None
         
-        # Vehicles on this lane
+        # Vehicles on this lane; the list stays sorted for iteration and
+        # neighbor search, the id set answers membership in O(1) on the
+        # hot add/remove paths (lane transitions every tick)
         self.vehicles: List['Vehicle'] = []
-        
+        self._vehicle_ids: set = set()
+        # Parallel list of the vehicles' positions at the last sort, so
+        # the binary searches probe plain floats instead of paying a
+        # Python key-callable call per comparison
+        self._xs: List[float] = []
+
         # Traffic generators
         self.generators: List['TrafficGenerator'] = []
-        
+
         # Road-side units (detectors, traffic lights, etc.)
         self.rsus: List['RSU'] = []
-        
+        self._rsu_set: set = set()
+
         # Observers
         self.observers: List['Observer'] = []
+        self._observer_set: set = set()
         
         # Speed limit [m/s]
         self.speed_limit = 33.33  # ~120 km/h default
         
         # Lane properties
         self.width = 3.5  # Standard lane width [m]
+
+        # Cached static half of to_dict (geometry + connections),
+        # invalidated by the connection/coordinate setters
+        self._static_dict_part: Optional[Dict[str, Any]] = None
         
     def add_vehicle(self, vehicle: 'Vehicle'):
         """Add vehicle to this lane"""
-        if vehicle not in self.vehicles:
-            self.vehicles.append(vehicle)
-            # Sort vehicles by position for efficient neighbor finding
-            self.vehicles.sort(key=lambda v: v.get_x())
-            
+        if vehicle.id not in self._vehicle_ids:
+            self._vehicle_ids.add(vehicle.id)
+            # Insert at the sorted position for efficient neighbor
+            # finding - O(log N) compares + shift instead of a full sort
+            position = vehicle.state.x
+            idx = bisect_right(self._xs, position)
+            self.vehicles.insert(idx, vehicle)
+            self._xs.insert(idx, position)
+
             # Update vehicle's lane reference
             vehicle.lane = self
-            
+
             # Notify observers
             for observer in self.observers:
                 observer.observe_vehicle_added(self, vehicle)
-    
+
     def remove_vehicle(self, vehicle: 'Vehicle'):
         """Remove vehicle from this lane"""
-        if vehicle in self.vehicles:
-            self.vehicles.remove(vehicle)
-            
+        if vehicle.id in self._vehicle_ids:
+            self._vehicle_ids.discard(vehicle.id)
+            idx = self._index_of(vehicle)
+            del self.vehicles[idx]
+            del self._xs[idx]
+
             # Notify observers
             for observer in self.observers:
                 observer.observe_vehicle_removed(self, vehicle)
+
+    def _index_of(self, vehicle: 'Vehicle') -> int:
+        """Locate a vehicle in the sorted list
+
+        Binary search on position plus an identity check among equal
+        keys, instead of list.remove's front-to-back equality scan. If
+        the vehicle moved since the last sort (stale order mid-tick) the
+        linear scan fallback still finds it.
+        """
+        vehicles = self.vehicles
+        xs = self._xs
+        position = vehicle.state.x
+        idx = bisect_left(xs, position)
+        for i in range(idx, len(vehicles)):
+            if vehicles[i] is vehicle:
+                return i
+            if xs[i] != position:
+                break
+        return vehicles.index(vehicle)
     
     def get_vehicles(self) -> List['Vehicle']:
-        """Get all vehicles on this lane"""
+        """Get all vehicles on this lane (defensive copy)"""
         return self.vehicles.copy()
+
+    def iter_vehicles(self):
+        """Iterate vehicles in position order without copying the list
+
+        For read-only walks; callers that mutate the lane during
+        iteration should use get_vehicles instead.
+        """
+        return iter(self.vehicles)
     
     def get_vehicle_count(self) -> int:
         """Get number of vehicles on this lane"""
         return len(self.vehicles)
     
     def get_leading_vehicle(self, position: float) -> Optional['Vehicle']:
-        """Get the vehicle ahead of given position"""
-        candidates = [v for v in self.vehicles if v.get_x() > position]
-        if candidates:
-            return min(candidates, key=lambda v: v.get_x())
-        return None
-    
+        """Get the vehicle ahead of given position
+
+        The lane list is kept sorted by position, so this is an O(log N)
+        binary search instead of a full scan.
+        """
+        idx = bisect_right(self._xs, position)
+        return self.vehicles[idx] if idx < len(self.vehicles) else None
+
     def get_following_vehicle(self, position: float) -> Optional['Vehicle']:
         """Get the vehicle behind given position"""
-        candidates = [v for v in self.vehicles if v.get_x() < position]
-        if candidates:
-            return max(candidates, key=lambda v: v.get_x())
-        return None
-    
-    def get_neighbors(self, vehicle: 'Vehicle') -> Dict[str, Optional['Vehicle']]:
-        """Get neighboring vehicles for a given vehicle"""
+        idx = bisect_left(self._xs, position)
+        return self.vehicles[idx - 1] if idx > 0 else None
+
+    def resort(self):
+        """Re-sort the lane by position and refresh the position index
+
+        Called once per tick before neighbor queries; timsort is near
+        O(N) on the almost-sorted order produced by forward motion.
+        """
+        self.vehicles.sort(key=_vehicle_x)
+        self._xs = [vehicle.state.x for vehicle in self.vehicles]
+    
+    def find_neighbors(self, position: float,
+                       grid: Optional[Dict[Tuple[int, int], List['Vehicle']]] = None
+                       ) -> Tuple[Optional['Vehicle'], Optional['Vehicle']]:
+        """Get the (leader, follower) pair around a position
+
+        With a model spatial grid the probe touches at most two GRID_CELL
+        buckets per direction; the lane-wide binary search is only needed
+        when the neighbor is more than a cell away (sparse traffic).
+        """
+        if grid is None:
+            return (self.get_leading_vehicle(position),
+                    self.get_following_vehicle(position))
+
+        cell = int(position // GRID_CELL)
+        leader = follower = None
+
+        bucket = grid.get((self.id, cell))
+        if bucket:
+            idx = bisect_right(bucket, position, key=_vehicle_x)
+            if idx < len(bucket):
+                leader = bucket[idx]
+            idx = bisect_left(bucket, position, key=_vehicle_x)
+            if idx > 0:
+                follower = bucket[idx - 1]
+
+        if leader is None:
+            ahead = grid.get((self.id, cell + 1))
+            # Everything in the next cell lies beyond position, so its
+            # first entry is the nearest candidate
+            leader = ahead[0] if ahead else self.get_leading_vehicle(position)
+        if follower is None:
+            behind = grid.get((self.id, cell - 1))
+            follower = behind[-1] if behind else self.get_following_vehicle(position)
+
+        return leader, follower
+
+    def get_neighbors(self, vehicle: 'Vehicle') -> 'Neighbors':
+        """Get neighboring vehicles for a given vehicle
+
+        Returns a Neighbors tuple; lateral slots are None when no
+        adjacent lane exists.
+        """
         position = vehicle.get_x()
-        
-        neighbors = {
-            'leader': self.get_leading_vehicle(position),
-            'follower': self.get_following_vehicle(position)
-        }
-        
-        # Add lateral neighbors if adjacent lanes exist
+
+        left_leader = left_follower = None
         if self.left_lane:
-            neighbors['left_leader'] = self.left_lane.get_leading_vehicle(position)
-            neighbors['left_follower'] = self.left_lane.get_following_vehicle(position)
-        
+            left_leader = self.left_lane.get_leading_vehicle(position)
+            left_follower = self.left_lane.get_following_vehicle(position)
+
+        right_leader = right_follower = None
         if self.right_lane:
-            neighbors['right_leader'] = self.right_lane.get_leading_vehicle(position)
-            neighbors['right_follower'] = self.right_lane.get_following_vehicle(position)
-        
-        return neighbors
-    
-    def update_vehicle_surroundings(self):
-        """Update surrounding vehicle information for all vehicles on this lane"""
-        from .vehicle import Enclosure
-        
-        for vehicle in self.vehicles:
-            neighbors = self.get_neighbors(vehicle)
-            
-            # Update enclosure mapping
-            vehicle.update_surrounding(Enclosure.FRONT, neighbors.get('leader'))
-            vehicle.update_surrounding(Enclosure.BACK, neighbors.get('follower'))
-            vehicle.update_surrounding(Enclosure.LEFT_FRONT, neighbors.get('left_leader'))
-            vehicle.update_surrounding(Enclosure.LEFT_BACK, neighbors.get('left_follower'))
-            vehicle.update_surrounding(Enclosure.RIGHT_FRONT, neighbors.get('right_leader'))
-            vehicle.update_surrounding(Enclosure.RIGHT_BACK, neighbors.get('right_follower'))
+            right_leader = self.right_lane.get_leading_vehicle(position)
+            right_follower = self.right_lane.get_following_vehicle(position)
+
+        return Neighbors(self.get_leading_vehicle(position),
+                         self.get_following_vehicle(position),
+                         left_leader, left_follower,
+                         right_leader, right_follower)
+    
+    def update_vehicle_surroundings(self, grid: Optional[Dict[Tuple[int, int],
+                                                              List['Vehicle']]] = None,
+                                    presorted: bool = False):
+        """Update surrounding vehicle information for all vehicles on this lane
+
+        grid is the model-level spatial index (see
+        TrafficSimulationModel._rebuild_spatial_grid); when given, the
+        lateral probes touch only the adjacent cells instead of searching
+        the whole neighbor lane. presorted=True skips the lane resort
+        when the caller has already refreshed the order this tick (the
+        grid rebuild owns the per-tick resort); standalone callers keep
+        the default and get sorted data.
+        """
+        if not presorted:
+            # Keep the lane order and the position index fresh
+            self.resort()
+        count = len(self.vehicles)
+        left_lane = self.left_lane
+        right_lane = self.right_lane
+
+        for i, vehicle in enumerate(self.vehicles):
+            position = vehicle.get_x()
+            if left_lane is not None:
+                left_front, left_back = left_lane.find_neighbors(position, grid)
+            else:
+                left_front = left_back = None
+            if right_lane is not None:
+                right_front, right_back = right_lane.find_neighbors(position, grid)
+            else:
+                right_front = right_back = None
+
+            # Same-lane leader/follower are just the sorted neighbors -
+            # no per-vehicle scan needed; all six slots land in one call
+            vehicle.set_neighbors((
+                self.vehicles[i + 1] if i + 1 < count else None,
+                self.vehicles[i - 1] if i > 0 else None,
+                left_front, left_back, right_front, right_back))
     
     def get_density(self) -> float:
         """Calculate traffic density [vehicles/km]"""
-        if self.length <= 0:
-            return 0.0
-        return (len(self.vehicles) / self.length) * 1000.0
+        return len(self.vehicles) * self._inv_length_km
     
     def get_flow(self) -> float:
         """Calculate traffic flow [vehicles/hour] - simplified calculation"""
@@ -195,59 +331,90 @@ class Lane:
         
         return True
     
+    def set_coordinates(self, coordinates: List[Coordinate]):
+        """Replace the lane geometry and refresh derived quantities"""
+        self.coordinates = coordinates
+        self._update_geometry()
+        self._static_dict_part = None
+
+    def _update_geometry(self):
+        """Precompute geometry invariants from the coordinate list
+
+        The endpoints, deltas and heading only change when coordinates
+        are replaced, so the per-call interpolation and atan2 reduce to
+        O(1) reads of these fields.
+        """
+        start = self.coordinates[0]
+        end = self.coordinates[-1]
+        self._start = start
+        self._dx = end.x - start.x
+        self._dy = end.y - start.y
+        if len(self.coordinates) >= 2:
+            self._heading = math.atan2(self._dy, self._dx)
+        else:
+            self._heading = 0.0
+        # Reciprocals so the per-call density/interpolation divisions
+        # become multiplies; zero keeps degenerate lanes at density 0
+        if self.length > 0:
+            self._inv_length = 1.0 / self.length
+            self._inv_length_km = 1000.0 / self.length
+        else:
+            self._inv_length = 0.0
+            self._inv_length_km = 0.0
+
     def get_coordinate_at_distance(self, distance: float) -> Coordinate:
         """Get coordinate at given distance along the lane"""
         if distance <= 0:
             return self.coordinates[0]
         if distance >= self.length:
             return self.coordinates[-1]
-        
+
         # Simple linear interpolation for now
         # In a more sophisticated implementation, this would handle curves
-        ratio = distance / self.length
-        start = self.coordinates[0]
-        end = self.coordinates[-1]
-        
+        ratio = distance * self._inv_length
+        start = self._start
         return Coordinate(
-            start.x + ratio * (end.x - start.x),
-            start.y + ratio * (end.y - start.y)
+            start.x + ratio * self._dx,
+            start.y + ratio * self._dy
         )
-    
+
     def get_heading_at_distance(self, distance: float) -> float:
         """Get lane heading (angle) at given distance"""
         # Simplified: assume straight lane
-        if len(self.coordinates) < 2:
-            return 0.0
-        
-        start = self.coordinates[0]
-        end = self.coordinates[-1]
-        
-        return math.atan2(end.y - start.y, end.x - start.x)
+        return self._heading
     
     # Lane connection methods
     def set_upstream_lane(self, lane: 'Lane'):
         """Set upstream (feeding) lane"""
         self.upstream_lane = lane
+        self._static_dict_part = None
         if lane:
             lane.downstream_lane = self
-    
+            lane._static_dict_part = None
+
     def set_downstream_lane(self, lane: 'Lane'):
         """Set downstream (receiving) lane"""
         self.downstream_lane = lane
+        self._static_dict_part = None
         if lane:
             lane.upstream_lane = self
-    
+            lane._static_dict_part = None
+
     def set_left_lane(self, lane: 'Lane'):
         """Set left adjacent lane"""
         self.left_lane = lane
+        self._static_dict_part = None
         if lane:
             lane.right_lane = self
-    
+            lane._static_dict_part = None
+
     def set_right_lane(self, lane: 'Lane'):
         """Set right adjacent lane"""
         self.right_lane = lane
+        self._static_dict_part = None
         if lane:
             lane.left_lane = self
+            lane._static_dict_part = None
     
     def get_left_lane(self) -> Optional['Lane']:
         """Get left adjacent lane"""
@@ -268,13 +435,15 @@ class Lane:
     # RSU (Road Side Unit) management
     def add_rsu(self, rsu: 'RSU'):
         """Add road-side unit (detector, traffic light, etc.)"""
-        if rsu not in self.rsus:
+        if rsu not in self._rsu_set:
+            self._rsu_set.add(rsu)
             self.rsus.append(rsu)
             rsu.set_lane(self)
-    
+
     def remove_rsu(self, rsu: 'RSU'):
         """Remove road-side unit"""
-        if rsu in self.rsus:
+        if rsu in self._rsu_set:
+            self._rsu_set.discard(rsu)
             self.rsus.remove(rsu)
     
     def get_rsus(self) -> List['RSU']:
@@ -284,32 +453,43 @@ class Lane:
     # Observer pattern
     def add_observer(self, observer: 'Observer'):
         """Add observer for lane events"""
-        if observer not in self.observers:
+        if observer not in self._observer_set:
+            self._observer_set.add(observer)
             self.observers.append(observer)
-    
+
     def remove_observer(self, observer: 'Observer'):
         """Remove observer"""
-        if observer in self.observers:
+        if observer in self._observer_set:
+            self._observer_set.discard(observer)
             self.observers.remove(observer)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert lane to dictionary for JSON serialization"""
+        """Convert lane to dictionary for JSON serialization
+
+        Geometry and connections rarely change, so that half is cached
+        and only the per-tick traffic measures are recomputed per call.
+        """
+        static_part = self._static_dict_part
+        if static_part is None:
+            static_part = self._static_dict_part = {
+                'id': self.id,
+                'type': self.type.value,
+                'length': self.length,
+                'width': self.width,
+                'speed_limit': self.speed_limit,
+                'coordinates': [{'x': c.x, 'y': c.y} for c in self.coordinates],
+                'connections': {
+                    'upstream': self.upstream_lane.id if self.upstream_lane else None,
+                    'downstream': self.downstream_lane.id if self.downstream_lane else None,
+                    'left': self.left_lane.id if self.left_lane else None,
+                    'right': self.right_lane.id if self.right_lane else None
+                }
+            }
         return {
-            'id': self.id,
-            'type': self.type.value,
-            'length': self.length,
-            'width': self.width,
-            'speed_limit': self.speed_limit,
+            **static_part,
             'vehicle_count': len(self.vehicles),
             'density': self.get_density(),
-            'average_speed': self.get_average_speed(),
-            'coordinates': [{'x': c.x, 'y': c.y} for c in self.coordinates],
-            'connections': {
-                'upstream': self.upstream_lane.id if self.upstream_lane else None,
-                'downstream': self.downstream_lane.id if self.downstream_lane else None,
-                'left': self.left_lane.id if self.left_lane else None,
-                'right': self.right_lane.id if self.right_lane else None
-            }
+            'average_speed': self.get_average_speed()
         }
     
     def __str__(self):
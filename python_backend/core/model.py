@@ -6,12 +6,18 @@ from typing import List, Dict, Optional, Any, Set
 import time
 import threading
 import json
+import logging
 from dataclasses import dataclass, asdict
 from enum import Enum
 
-from .vehicle import Vehicle, VehicleInterface, Observer as VehicleObserver
-from .driver import DriverInterface, create_driver, DriverType, Route
-from .lane import Lane, LaneType, Coordinate
+from .vehicle import Vehicle, VehicleInterface, Enclosure, Observer as VehicleObserver
+from .driver import DriverInterface, IDMDriver, create_driver, DriverType, Route
+from .lane import Lane, LaneType, Coordinate, GRID_CELL
+from .vehicle_array import VehicleArray
+from . import kernels
+
+
+_log = logging.getLogger(__name__)
 
 
 class SimulationState(Enum):
@@ -29,6 +35,7 @@ class SimulationSettings:
     max_simulation_time: float = 3600.0  # Maximum simulation time in seconds
     debug_mode: bool = False
     real_time_factor: float = 1.0  # 1.0 = real time, 2.0 = 2x speed, etc.
+    observer_hz: float = 30.0  # Max observer notification rate [Hz]; <= 0 = every tick
     
 
 @dataclass
@@ -76,13 +83,35 @@ class TrafficSimulationModel:
         self.start_time = 0.0
         self.current_time = 0.0
         self.last_update_time = 0.0
+
+        # Step counter - also serves as a version token so snapshot caches
+        # can tell whether the simulation state has changed
+        self.tick_count = 0
+
+        # Next wall-clock deadline for observer notification (observer_hz)
+        self._next_notify_time = 0.0
+
+        # Cached immutable scenario data (lanes/routes), rebuilt lazily
+        # when the network is edited
+        self._static_data: Optional[Dict[str, Any]] = None
+
+        # Spatial index for cross-lane neighbor queries, keyed by
+        # (lane_id, cell) and rebuilt once per step
+        self._spatial_grid: Dict[tuple, List[Vehicle]] = {}
+
+        # Reusable SoA buffers for the batch move kernel, built lazily
+        # on first use (needs numpy)
+        self._vehicle_array: Optional[VehicleArray] = None
         
         # Threading
         self.simulation_thread: Optional[threading.Thread] = None
         self.stop_simulation_flag = False
         
-        # Observers for real-time updates
-        self.observers: List['SimulationObserver'] = []
+        # Observers for real-time updates. Stored as an immutable tuple
+        # replaced wholesale on add/remove (copy-on-write): notification
+        # reads the reference atomically, so the API thread can rewire
+        # observers mid-step without locks or "list changed size" races.
+        self.observers: tuple = ()
         
         # Vehicle ID counter
         self.next_vehicle_id = 1
@@ -99,7 +128,30 @@ class TrafficSimulationModel:
     def reset_instance(cls):
         """Reset singleton instance"""
         cls._instance = None
-    
+
+    def clear(self):
+        """Reset simulation state in place
+
+        Unlike reset_instance, this keeps the singleton (and any
+        registered observers) alive, so API layers can reset the
+        simulation without recreating and rewiring their objects.
+        """
+        self.stop_simulation()
+        self.settings = SimulationSettings()
+        self.stats = SimulationStats()
+        self.lanes.clear()
+        self.vehicles.clear()
+        self.drivers.clear()
+        self.routes.clear()
+        self.generators.clear()
+        self.start_time = 0.0
+        self.current_time = 0.0
+        self.last_update_time = 0.0
+        self.tick_count += 1  # Invalidate cached snapshots
+        self._static_data = None
+        self.next_vehicle_id = 1
+        self.next_driver_id = 1
+
     def initialize(self, lanes: List[Lane], settings: Optional[SimulationSettings] = None):
         """Initialize simulation with network and settings"""
         if settings:
@@ -118,19 +170,28 @@ class TrafficSimulationModel:
     def add_lane(self, lane: Lane):
         """Add a lane to the network"""
         self.lanes[lane.id] = lane
-        self._update_network()
-    
+        self._static_data = None
+        self.tick_count += 1  # Invalidate cached snapshots
+        self._update_network(lane)
+
     def remove_lane(self, lane_id: int):
         """Remove a lane from the network"""
         if lane_id in self.lanes:
-            # Remove all vehicles from the lane first
+            # Remove all vehicles from the lane first; one snapshot is
+            # enough since removal mutates the lane list
             lane = self.lanes[lane_id]
-            vehicles_to_remove = lane.get_vehicles().copy()
-            for vehicle in vehicles_to_remove:
+            for vehicle in lane.get_vehicles():
                 self.remove_vehicle(vehicle.id)
-            
+
             del self.lanes[lane_id]
-            self._update_network()
+            self._static_data = None
+            self.tick_count += 1  # Invalidate cached snapshots
+            # Refresh the former neighbors, which may still reference
+            # vehicles that were on the removed lane
+            for neighbor in (lane.left_lane, lane.right_lane,
+                             lane.upstream_lane, lane.downstream_lane):
+                if neighbor is not None:
+                    self._update_network(neighbor)
     
     def add_vehicle(self, lane_id: int, driver_type: DriverType = DriverType.IDM, 
                    initial_position: float = 0.0, route: Optional[Route] = None) -> Optional[Vehicle]:
@@ -160,7 +221,8 @@ class TrafficSimulationModel:
         self.next_driver_id += 1
         self.stats.total_vehicles += 1
         self.stats.active_vehicles += 1
-        
+        self.tick_count += 1  # Invalidate cached snapshots
+
         return vehicle
     
     def remove_vehicle(self, vehicle_id: int):
@@ -186,6 +248,7 @@ class TrafficSimulationModel:
                 self.stats.crashed_vehicles += 1
             else:
                 self.stats.completed_vehicles += 1
+            self.tick_count += 1  # Invalidate cached snapshots
     
     def add_route(self, route: Route):
         """Add a route to the simulation"""
@@ -216,26 +279,30 @@ class TrafficSimulationModel:
         self.start_time = time.time()
         self.current_time = 0.0
         self.stop_simulation_flag = False
-        
+        self.tick_count += 1  # Invalidate cached snapshots
+
         # Start simulation thread
         self.simulation_thread = threading.Thread(target=self._simulation_loop)
         self.simulation_thread.start()
-    
+
     def pause_simulation(self):
         """Pause the simulation"""
         if self.state == SimulationState.RUNNING:
             self.state = SimulationState.PAUSED
-    
+            self.tick_count += 1  # Invalidate cached snapshots
+
     def resume_simulation(self):
         """Resume the simulation"""
         if self.state == SimulationState.PAUSED:
             self.state = SimulationState.RUNNING
-    
+            self.tick_count += 1  # Invalidate cached snapshots
+
     def stop_simulation(self):
         """Stop the simulation"""
         self.stop_simulation_flag = True
         self.state = SimulationState.STOPPED
-        
+        self.tick_count += 1  # Invalidate cached snapshots
+
         if self.simulation_thread and self.simulation_thread.is_alive():
             self.simulation_thread.join(timeout=1.0)
     
@@ -244,83 +311,301 @@ class TrafficSimulationModel:
         if self.state in [SimulationState.STOPPED, SimulationState.PAUSED]:
             self._update_simulation(self.settings.time_step)
             self.state = SimulationState.PAUSED
+
+    def step(self, dt: Optional[float] = None):
+        """Advance the simulation by one tick, unconditionally
+
+        Public entry point for headless/scripted use (no background
+        thread, no state-machine gating). The update is two-phase:
+        surroundings and accelerations are computed for the whole fleet
+        from the pre-step snapshot first, and only then is every vehicle
+        integrated, so results do not depend on iteration order.
+        Observers are notified once per tick, after the batch.
+
+        dt defaults to settings.time_step.
+        """
+        self._update_simulation(dt if dt is not None else self.settings.time_step)
     
     def _simulation_loop(self):
-        """Main simulation loop running in separate thread"""
-        last_real_time = time.time()
-        
+        """Main simulation loop running in separate thread
+
+        Pacing uses absolute monotonic deadlines, so per-tick scheduling
+        error does not accumulate into drift. real_time_factor <= 0 means
+        "no pacing": the loop runs as fast as the CPU allows, which is
+        what batch runs want.
+        """
+        next_tick = time.monotonic()
+
         while not self.stop_simulation_flag and self.state != SimulationState.STOPPED:
             if self.state == SimulationState.RUNNING:
-                # Calculate time step
-                current_real_time = time.time()
-                real_dt = current_real_time - last_real_time
-                sim_dt = real_dt * self.settings.real_time_factor
-                
                 # Use fixed time step for stability
                 dt = self.settings.time_step
-                
+
                 # Update simulation
                 self._update_simulation(dt)
-                
-                # Sleep to maintain real-time factor
-                if self.settings.real_time_factor > 0:
-                    sleep_time = self.settings.time_step / self.settings.real_time_factor
-                    if sleep_time > 0:
-                        time.sleep(sleep_time)
+
+                # Sleep until the next absolute deadline
+                rtf = self.settings.real_time_factor
+                if rtf > 0:
+                    next_tick += dt / rtf
+                    delay = next_tick - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        # Fell behind (slow tick); rebase instead of
+                        # sprinting through a backlog of deadlines
+                        next_tick = time.monotonic()
                 else:
-                    print("Warning: real_time_factor must be greater than 0. Skipping sleep.")
-                
-                last_real_time = current_real_time
+                    next_tick = time.monotonic()
             else:
                 # Paused - small sleep to avoid busy waiting
                 time.sleep(0.01)
+                next_tick = time.monotonic()
     
     def _update_simulation(self, dt: float):
         """Update simulation by one time step"""
         # Update current simulation time
+        self.tick_count += 1
         self.current_time += dt
         self.stats.current_time = self.current_time
         
-        # Update all lanes (vehicle surroundings)
+        # Update all lanes (vehicle surroundings), sharing one spatial
+        # grid so lateral probes touch only adjacent cells; the grid
+        # rebuild resorts every lane, so the surroundings pass skips its
+        # own resort
+        self._rebuild_spatial_grid()
         for lane in self.lanes.values():
-            lane.update_vehicle_surroundings()
+            lane.update_vehicle_surroundings(self._spatial_grid, presorted=True)
         
         # Execute driver behaviors
-        for driver in self.drivers.values():
-            try:
-                driver.drive()
-            except Exception as e:
-                print(f"Error in driver {driver.get_id()}: {e}")
-        
-        # Move all vehicles
-        for vehicle in list(self.vehicles.values()):
-            try:
-                vehicle.move(dt)
-                
-                # Check if vehicle has left the network
-                if self._has_vehicle_exited(vehicle):
-                    self.remove_vehicle(vehicle.id)
-                    
-            except Exception as e:
-                print(f"Error moving vehicle {vehicle.id}: {e}")
-        
+        self._drive_all_vehicles()
+        
+        # Move all vehicles, accumulating the per-lane statistics inputs
+        # in the same walk so the fleet is traversed once, not twice.
+        # One exception guard per phase instead of per vehicle keeps
+        # handler setup out of the inner loop.
+        try:
+            lane_totals = self._move_all_vehicles(dt)
+        except Exception:
+            _log.exception("Error in vehicle move phase")
+            lane_totals = {}
+
         # Run traffic generators
-        for generator in self.generators:
-            try:
+        try:
+            for generator in self.generators:
                 generator.update(dt)
-            except Exception as e:
-                print(f"Error in traffic generator: {e}")
-        
-        # Update statistics
-        self._update_statistics()
-        
-        # Notify observers
-        for observer in self.observers:
-            try:
-                observer.simulation_updated(self)
-            except Exception as e:
-                print(f"Error notifying observer: {e}")
+        except Exception:
+            _log.exception("Error in traffic generator")
+
+        # Update statistics from the accumulators filled during the move
+        self._update_statistics(lane_totals)
+
+        # Notify observers, throttled to observer_hz so serialization
+        # work does not scale with the tick rate
+        hz = self.settings.observer_hz
+        now = time.monotonic()
+        if hz <= 0 or now >= self._next_notify_time:
+            self._next_notify_time = now + 1.0 / hz if hz > 0 else 0.0
+            for observer in self.observers:
+                try:
+                    observer.simulation_updated(self)
+                except Exception:
+                    _log.exception("Error notifying observer")
     
+    def _move_all_vehicles(self, dt: float) -> Dict[int, List[float]]:
+        """Move every vehicle one step, batching the kinematics if possible
+
+        Returns the per-lane [speed_sum, count] accumulators consumed by
+        _update_statistics. With numpy available, the integration
+        arithmetic for the whole fleet runs as a handful of array ops
+        over the reusable VehicleArray buffers; otherwise each vehicle
+        integrates itself via Vehicle.move.
+        """
+        if kernels.HAVE_NUMPY and self.vehicles:
+            return self._move_all_vehicles_batch(dt)
+        return self._move_all_vehicles_scalar(dt)
+
+    def _move_all_vehicles_scalar(self, dt: float) -> Dict[int, List[float]]:
+        """Per-object move path used when numpy is unavailable
+
+        Removals are deferred so the vehicle dict can be iterated
+        directly, without snapshotting the whole fleet into a list
+        every tick.
+        """
+        half_dt2 = 0.5 * dt * dt
+        lane_totals: Dict[int, List[float]] = {}
+        pending_removal: List[int] = []
+        for vehicle in self.vehicles.values():
+            vehicle.move(dt, half_dt2)
+
+            # Per-vehicle observers (rarely registered) are dispatched
+            # here, keeping Vehicle.move free of the loop
+            if vehicle.observers and not vehicle.state.crashed:
+                for observer in vehicle.observers:
+                    observer.observe_vehicle_move(vehicle)
+
+            # Check if vehicle has left the network
+            if self._has_vehicle_exited(vehicle):
+                pending_removal.append(vehicle.id)
+                continue
+
+            totals = lane_totals.get(vehicle.lane.id)
+            if totals is None:
+                lane_totals[vehicle.lane.id] = [vehicle.state.velocity, 1]
+            else:
+                totals[0] += vehicle.state.velocity
+                totals[1] += 1
+        for vehicle_id in pending_removal:
+            self.remove_vehicle(vehicle_id)
+        return lane_totals
+
+    def _move_all_vehicles_batch(self, dt: float) -> Dict[int, List[float]]:
+        """Vectorized move path: gather -> step_kinematics -> scatter
+
+        The N per-vehicle Python integrations collapse into one kernel
+        call over struct-of-arrays columns; the Python walk that remains
+        only does the non-numeric bookkeeping (lane-change completion,
+        debug trace, vehicle observers, exit checks, statistics).
+        """
+        array = self._vehicle_array
+        if array is None:
+            array = self._vehicle_array = VehicleArray()
+        vehicles = array.gather(self.vehicles.values())
+        n = array.n
+        # dt is constant across a run, so the specialized kernel is a
+        # memoized lookup after the first tick
+        finished = kernels.make_step_kernel(dt)(
+            array.x[:n], array.y[:n], array.velocity[:n],
+            array.acceleration[:n], array.dy[:n], array.progress[:n],
+            array.crashed[:n])
+        array.scatter()
+
+        trace = Vehicle.DEBUG_TRACE
+        now = time.time() if trace else 0.0
+        lane_totals: Dict[int, List[float]] = {}
+        pending_removal: List[int] = []
+        for i, vehicle in enumerate(vehicles):
+            state = vehicle.state
+            if not state.crashed:
+                if trace:
+                    vehicle.accelerations[now] = state.acceleration
+                if finished[i]:
+                    vehicle.end_lane_change()
+                if vehicle.observers:
+                    for observer in vehicle.observers:
+                        observer.observe_vehicle_move(vehicle)
+
+            if self._has_vehicle_exited(vehicle):
+                pending_removal.append(vehicle.id)
+                continue
+
+            totals = lane_totals.get(vehicle.lane.id)
+            if totals is None:
+                lane_totals[vehicle.lane.id] = [state.velocity, 1]
+            else:
+                totals[0] += state.velocity
+                totals[1] += 1
+        for vehicle_id in pending_removal:
+            self.remove_vehicle(vehicle_id)
+        return lane_totals
+
+    def _drive_all_vehicles(self):
+        """Execute driver behaviors, batching the IDM math when possible
+
+        With numpy available, the car-following formula for all IDM
+        drivers is evaluated in one vectorized kernel call over
+        struct-of-arrays inputs instead of once per driver in Python.
+        Other driver types (and the no-numpy fallback) use the per-driver
+        scalar path.
+        """
+        if not kernels.HAVE_NUMPY:
+            try:
+                for driver in self.drivers.values():
+                    driver.drive()
+            except Exception:
+                _log.exception("Error in driver phase")
+            return
+
+        np = kernels.np
+        idm_drivers = []
+        other_drivers = []
+        for driver in self.drivers.values():
+            vehicle = driver.get_vehicle()
+            if (isinstance(driver, IDMDriver) and vehicle is not None
+                    and not vehicle.state.crashed
+                    and driver.acceleration_exponent == 4):
+                idm_drivers.append(driver)
+            else:
+                other_drivers.append(driver)
+
+        if idm_drivers:
+            # Gather driver/vehicle state into parallel columns; the gap
+            # is derived inside the kernel from the raw positions
+            n = len(idm_drivers)
+            v = np.empty(n)
+            x = np.empty(n)
+            v_lead = np.empty(n)
+            x_lead = np.empty(n)
+            leader_length = np.empty(n)
+            v0 = np.empty(n)
+            T = np.empty(n)
+            s0 = np.empty(n)
+            a_max = np.empty(n)
+            b = np.empty(n)
+            for i, driver in enumerate(idm_drivers):
+                vehicle = driver.vehicle
+                state = vehicle.state
+                v[i] = state.velocity
+                x[i] = state.x
+                leader = vehicle.surrounding[Enclosure.FRONT]
+                if leader is None:
+                    v_lead[i] = kernels.NO_LEADER
+                    x_lead[i] = 0.0  # Unused for free-flow entries
+                    leader_length[i] = 0.0
+                else:
+                    v_lead[i] = leader.state.velocity
+                    x_lead[i] = leader.state.x
+                    leader_length[i] = leader.length
+                v0[i] = driver.desired_speed
+                T[i] = driver.time_headway
+                s0[i] = driver.min_spacing
+                a_max[i] = driver.max_acceleration
+                b[i] = driver.comfortable_deceleration
+
+            accelerations = kernels.idm_accelerations(v, x, v_lead, x_lead,
+                                                      leader_length,
+                                                      v0, T, s0, a_max, b)
+            try:
+                for driver, acceleration in zip(idm_drivers, accelerations.tolist()):
+                    driver.apply_acceleration(acceleration)
+            except Exception:
+                _log.exception("Error in driver phase")
+
+        try:
+            for driver in other_drivers:
+                driver.drive()
+        except Exception:
+            _log.exception("Error in driver phase")
+
+    def _rebuild_spatial_grid(self):
+        """Rebuild the (lane_id, cell) -> vehicles spatial index
+
+        Lane lists are sorted first, so buckets filled in list order stay
+        position-sorted and Lane.find_neighbors can bisect within them.
+        """
+        grid = self._spatial_grid
+        grid.clear()
+        for lane in self.lanes.values():
+            lane.resort()
+            lane_id = lane.id
+            for vehicle in lane.vehicles:
+                key = (lane_id, int(vehicle.state.x // GRID_CELL))
+                bucket = grid.get(key)
+                if bucket is None:
+                    grid[key] = [vehicle]
+                else:
+                    bucket.append(vehicle)
+
     def _has_vehicle_exited(self, vehicle: Vehicle) -> bool:
         """Check if vehicle has exited the network"""
         lane = vehicle.get_lane()
@@ -332,64 +617,166 @@ class TrafficSimulationModel:
         
         return False
     
-    def _update_network(self):
-        """Update network connectivity and vehicle surroundings"""
-        for lane in self.lanes.values():
+    def _update_network(self, changed_lane: Optional[Lane] = None):
+        """Update network connectivity and vehicle surroundings
+
+        With changed_lane given, only that lane and its direct neighbors
+        are refreshed instead of re-sweeping every lane in the network.
+        """
+        if changed_lane is None:
+            lanes = list(self.lanes.values())
+        else:
+            lanes = {changed_lane, changed_lane.left_lane, changed_lane.right_lane,
+                     changed_lane.upstream_lane, changed_lane.downstream_lane}
+            lanes.discard(None)
+        for lane in lanes:
             lane.update_vehicle_surroundings()
     
-    def _update_statistics(self):
-        """Update simulation statistics"""
+    def _update_statistics(self, lane_totals: Optional[Dict[int, List[float]]] = None):
+        """Update simulation statistics from per-lane speed accumulators
+
+        lane_totals maps lane_id -> [speed_sum, count]. During a step the
+        move loop fills it in the same walk that advances the vehicles;
+        for standalone calls it is rebuilt here. Flow reduces to
+        sum(v)/length*3600 per lane, so all three aggregates come out of
+        the accumulators without re-walking the fleet.
+        """
         self.stats.active_vehicles = len(self.vehicles)
-        
-        if self.vehicles:
-            total_speed = sum(v.get_velocity() for v in self.vehicles.values())
-            self.stats.average_speed = total_speed / len(self.vehicles)
-        else:
-            self.stats.average_speed = 0.0
-        
-        # Calculate total flow and average density
+
+        if lane_totals is None:
+            lane_totals = {}
+            for lane in self.lanes.values():
+                if lane.vehicles:
+                    lane_speed = 0.0
+                    for vehicle in lane.vehicles:
+                        lane_speed += vehicle.state.velocity
+                    lane_totals[lane.id] = [lane_speed, len(lane.vehicles)]
+
+        total_speed = 0.0
+        total_count = 0
         total_flow = 0.0
         total_density = 0.0
+
+        for lane_id, (speed_sum, count) in lane_totals.items():
+            lane = self.lanes.get(lane_id)
+            if lane is None:
+                continue
+            total_speed += speed_sum
+            total_count += count
+            # density * avg_speed * 3.6 == sum(v) / length * 3600
+            total_flow += speed_sum * lane._inv_length * 3600.0
+            total_density += count * lane._inv_length_km
+
         lane_count = len(self.lanes)
-        
-        for lane in self.lanes.values():
-            total_flow += lane.get_flow()
-            total_density += lane.get_density()
-        
+        self.stats.average_speed = total_speed / total_count if total_count else 0.0
         self.stats.total_flow = total_flow
         self.stats.average_density = total_density / lane_count if lane_count > 0 else 0.0
     
     def add_observer(self, observer: 'SimulationObserver'):
         """Add simulation observer"""
         if observer not in self.observers:
-            self.observers.append(observer)
-    
+            self.observers = self.observers + (observer,)
+
     def remove_observer(self, observer: 'SimulationObserver'):
         """Remove simulation observer"""
         if observer in self.observers:
-            self.observers.remove(observer)
+            self.observers = tuple(o for o in self.observers if o is not observer)
     
-    def get_simulation_data(self) -> Dict[str, Any]:
-        """Get current simulation data for API/frontend"""
-        return {
+    def get_simulation_data(self, dynamic_only: bool = False) -> Dict[str, Any]:
+        """Get current simulation data for API/frontend
+
+        With dynamic_only=True the lane list is omitted - broadcasts can
+        then skip re-serializing geometry that never changes between
+        network edits (clients fetch it once via get_static_data).
+        """
+        data = {
             'state': self.state.value,
             'stats': asdict(self.stats),
             'settings': asdict(self.settings),
-            'vehicles': [vehicle.to_dict() for vehicle in self.vehicles.values()],
-            'lanes': [lane.to_dict() for lane in self.lanes.values()],
+            'tick': self.tick_count,
             'timestamp': time.time()
         }
+        if dynamic_only:
+            # Broadcasts use the compact column layout
+            data['vehicles'] = self.get_vehicle_columns()
+        else:
+            data['vehicles'] = [vehicle.to_dict() for vehicle in self.vehicles.values()]
+            data['lanes'] = [lane.to_dict() for lane in self.lanes.values()]
+        return data
+
+    def get_vehicle_columns(self, fields: Optional[tuple] = None
+                            ) -> Dict[str, List[Any]]:
+        """Get vehicle state as parallel columns (struct-of-arrays)
+
+        One key per column instead of one dict per vehicle roughly halves
+        the JSON size and lets the encoder walk flat lists instead of N
+        small dicts. fields selects a projection (see Vehicle.to_dict);
+        None returns all columns.
+        """
+        if fields is not None:
+            getters = [(name, Vehicle._FIELD_GETTERS[name]) for name in fields]
+            columns: Dict[str, List[Any]] = {name: [] for name, _ in getters}
+            for vehicle in self.vehicles.values():
+                for name, getter in getters:
+                    columns[name].append(getter(vehicle))
+            return columns
+
+        ids, xs, ys, velocities, accelerations = [], [], [], [], []
+        lane_ids, lengths, widths = [], [], []
+        changing, progress, direction, crashed = [], [], [], []
+
+        for vehicle in self.vehicles.values():
+            state = vehicle.state
+            ids.append(vehicle.id)
+            xs.append(state.x)
+            ys.append(state.y)
+            velocities.append(state.velocity)
+            accelerations.append(state.acceleration)
+            lane_ids.append(vehicle.lane.id if vehicle.lane else None)
+            lengths.append(vehicle.length)
+            widths.append(vehicle.width)
+            changing.append(vehicle._changing)
+            progress.append(state.lane_change_progress)
+            direction.append(vehicle.lc_direction.value if vehicle.lc_direction else None)
+            crashed.append(state.crashed)
+
+        return {
+            'id': ids, 'x': xs, 'y': ys,
+            'velocity': velocities, 'acceleration': accelerations,
+            'lane_id': lane_ids, 'length': lengths, 'width': widths,
+            'is_changing_lane': changing, 'lane_change_progress': progress,
+            'lane_change_direction': direction, 'crashed': crashed
+        }
+
+    def get_static_data(self) -> Dict[str, Any]:
+        """Get the immutable scenario data (lanes and routes), cached
+
+        Serialized once per network edit and reused for every new client
+        instead of being rebuilt per connection.
+        """
+        if self._static_data is None:
+            self._static_data = {
+                'lanes': [lane.to_dict() for lane in self.lanes.values()],
+                'routes': [
+                    {'id': route.id, 'lane_sequence': list(route.lane_sequence)}
+                    for route in self.routes.values()
+                ]
+            }
+        return self._static_data
     
     def load_scenario(self, scenario_data: Dict[str, Any]):
         """Load a predefined scenario"""
         # Clear existing simulation
         self.stop_simulation()
+        self.tick_count += 1  # Invalidate cached snapshots
+        self._static_data = None
         self.vehicles.clear()
         self.drivers.clear()
         self.lanes.clear()
         self.routes.clear()
         
-        # Load lanes
+        # Load lanes; insert directly and defer the surroundings sweep to
+        # a single _update_network call once everything is in place
         if 'lanes' in scenario_data:
             for lane_data in scenario_data['lanes']:
                 lane = Lane(
@@ -398,10 +785,10 @@ class TrafficSimulationModel:
                     length=lane_data.get('length', 1000.0)
                 )
                 if 'coordinates' in lane_data:
-                    lane.coordinates = [
+                    lane.set_coordinates([
                         Coordinate(c['x'], c['y']) for c in lane_data['coordinates']
-                    ]
-                self.add_lane(lane)
+                    ])
+                self.lanes[lane.id] = lane
         
         # Set up lane connections
         if 'connections' in scenario_data:
@@ -427,7 +814,7 @@ class TrafficSimulationModel:
         # Load initial vehicles
         if 'vehicles' in scenario_data:
             for vehicle_data in scenario_data['vehicles']:
-                driver_type = DriverType(vehicle_data.get('driver_type', 'IDM'))
+                driver_type = DriverType.coerce(vehicle_data.get('driver_type', 'IDM'))
                 route_id = vehicle_data.get('route_id')
                 route = self.routes.get(route_id) if route_id else None
                 
@@ -448,6 +835,10 @@ class TrafficSimulationModel:
                 real_time_factor=settings_data.get('real_time_factor', 1.0)
             )
 
+        # One network-wide sweep now that lanes, connections and vehicles
+        # are all in place (was O(L^2) when add_lane swept per insertion)
+        self._update_network()
+
 
 class SimulationObserver:
     """Observer interface for simulation updates"""
@@ -2,9 +2,8 @@
 Vehicle module - Python equivalent of Java Vehicle classes
 Converts the Java vehicle hierarchy to Python with similar functionality
 """
-from typing import Optional, Dict, List, Any
-from abc import ABC, abstractmethod
-from enum import Enum
+from typing import Optional, Dict, List, Any, Protocol
+from enum import Enum, IntEnum
 import math
 import time
 from dataclasses import dataclass
@@ -16,17 +15,21 @@ class LatDirection(Enum):
     RIGHT = "RIGHT"
 
 
-class Enclosure(Enum):
-    """Areas around a vehicle for neighbor detection"""
-    FRONT = "FRONT"
-    BACK = "BACK"
-    LEFT_FRONT = "LEFT_FRONT"
-    LEFT_BACK = "LEFT_BACK"
-    RIGHT_FRONT = "RIGHT_FRONT"
-    RIGHT_BACK = "RIGHT_BACK"
+class Enclosure(IntEnum):
+    """Areas around a vehicle for neighbor detection
 
+    Values are the indices into Vehicle.surrounding, so neighbor access
+    is a plain list index instead of a hashed dict lookup.
+    """
+    FRONT = 0
+    BACK = 1
+    LEFT_FRONT = 2
+    LEFT_BACK = 3
+    RIGHT_FRONT = 4
+    RIGHT_BACK = 5
 
-@dataclass
+
+@dataclass(slots=True)
 class VehicleState:
     """Current state of a vehicle"""
     x: float = 0.0  # Position along lane [m]
@@ -37,43 +40,59 @@ class VehicleState:
     crashed: bool = False
     
 
-class VehicleInterface(ABC):
-    """Abstract interface for vehicles - Python equivalent of jVehicle"""
-    
-    @abstractmethod
+class VehicleInterface(Protocol):
+    """Vehicle interface - Python equivalent of jVehicle
+
+    A typing.Protocol rather than an ABC: there is a single
+    implementation, and plain classes skip the abstract-registry and
+    metaclass machinery on instantiation - noticeable when thousands of
+    vehicles are created. Implementations satisfy the protocol
+    structurally instead of inheriting from it.
+    """
+
     def get_vehicle(self, area: Enclosure) -> Optional['VehicleInterface']:
         """Get neighboring vehicle in specified area"""
-        pass
-    
-    @abstractmethod
+        ...
+
     def update_surrounding(self, area: Enclosure, vehicle: Optional['VehicleInterface']):
         """Update neighboring vehicle information"""
-        pass
-    
-    @abstractmethod
+        ...
+
     def get_lane(self) -> 'Lane':
         """Get current lane"""
-        pass
-    
-    @abstractmethod
+        ...
+
     def get_x(self) -> float:
         """Get position along current lane [m]"""
-        pass
-    
-    @abstractmethod
+        ...
+
     def get_gap(self, leader: 'VehicleInterface') -> float:
         """Get net headway to leading vehicle [m]"""
-        pass
-    
-    @abstractmethod
+        ...
+
     def move(self, dt: float):
         """Move vehicle for time step dt"""
-        pass
+        ...
 
 
-class Vehicle(VehicleInterface):
-    """Main vehicle implementation - Python equivalent of Java Vehicle class"""
-    
+class Vehicle:
+    """Main vehicle implementation - Python equivalent of Java Vehicle class
+
+    Satisfies VehicleInterface structurally.
+    """
+
+    # Opt-in per-step acceleration trace. Off by default: recording did a
+    # time.time() syscall and an unbounded dict insert per vehicle per
+    # step, which dominates long release runs and leaks memory.
+    DEBUG_TRACE = False
+
+    # Fixed attribute set: thousands of vehicles are alive at once, and
+    # dropping the per-instance __dict__ cuts their memory roughly in
+    # half and speeds up attribute access
+    __slots__ = ('id', 'lane', 'state', 'length', 'width', 'v_max',
+                 'class_id', 'lc_direction', 'dy', '_changing', 'surrounding',
+                 'driver', 'observers', 'accelerations')
+
     def __init__(self, vehicle_id: int, lane: 'Lane', initial_x: float = 0.0):
         self.id = vehicle_id
         self.lane = lane
@@ -88,11 +107,13 @@ class Vehicle(VehicleInterface):
         # Lane change properties
         self.lc_direction: Optional[LatDirection] = None
         self.dy = 0.0  # Lateral speed
+        # Cached "mid lane change" flag, kept in sync by
+        # start_lane_change/end_lane_change/crash so the hot paths read
+        # one bool instead of chasing state.lane_change_progress
+        self._changing = False
         
-        # Surrounding vehicles
-        self.surrounding: Dict[Enclosure, Optional['Vehicle']] = {
-            area: None for area in Enclosure
-        }
+        # Surrounding vehicles, indexed by Enclosure value
+        self.surrounding: List[Optional['Vehicle']] = [None] * 6
         
         # Driver (will be set externally)
         self.driver: Optional['Driver'] = None
@@ -100,16 +121,25 @@ class Vehicle(VehicleInterface):
         # Observers
         self.observers: List['Observer'] = []
         
-        # Debug data
+        # Debug data (only filled while DEBUG_TRACE is enabled)
         self.accelerations: Dict[float, float] = {}
         
     def get_vehicle(self, area: Enclosure) -> Optional['Vehicle']:
         """Get neighboring vehicle in specified area"""
-        return self.surrounding.get(area)
-    
+        return self.surrounding[area]
+
     def update_surrounding(self, area: Enclosure, vehicle: Optional['Vehicle']):
         """Update neighboring vehicle information"""
         self.surrounding[area] = vehicle
+
+    def set_neighbors(self, neighbors: tuple):
+        """Replace all six surround slots in one call
+
+        neighbors is ordered like Enclosure (front, back, left_front,
+        left_back, right_front, right_back) - one dispatch per vehicle
+        per tick instead of six update_surrounding calls.
+        """
+        self.surrounding = list(neighbors)
     
     def get_lane(self) -> 'Lane':
         """Get current lane"""
@@ -133,7 +163,7 @@ class Vehicle(VehicleInterface):
     
     def is_changing_lane(self) -> bool:
         """Check if vehicle is currently changing lanes"""
-        return self.state.lane_change_progress > 0
+        return self._changing
     
     def get_lane_change_progress(self) -> float:
         """Get lane change progress [0-1]"""
@@ -149,20 +179,22 @@ class Vehicle(VehicleInterface):
         """Get net headway to leading vehicle [m]"""
         if leader is None:
             return float('inf')
-        
-        # Simple distance calculation (could be enhanced for curved lanes)
-        gap = leader.get_x() - self.get_x() - leader.length
-        return max(0.0, gap)
+
+        # Simple distance calculation (could be enhanced for curved lanes);
+        # direct state reads, this sits inside the per-driver hot loop
+        gap = leader.state.x - self.state.x - leader.length
+        return gap if gap > 0.0 else 0.0
     
     def start_lane_change(self, direction: LatDirection, duration: float = 3.0):
         """Start a lane change maneuver"""
-        if not self.is_changing_lane():
+        if not self._changing:
+            self._changing = True
             self.lc_direction = direction
             self.dy = 1.0 / duration  # Complete lane change in 'duration' seconds
     
     def end_lane_change(self):
         """Complete lane change and move to new lane"""
-        if self.is_changing_lane():
+        if self._changing:
             # Get target lane
             target_lane = None
             if self.lc_direction == LatDirection.LEFT:
@@ -178,40 +210,53 @@ class Vehicle(VehicleInterface):
                 target_lane.add_vehicle(self)
                 
             # Reset lane change state
+            self._changing = False
             self.state.lane_change_progress = 0.0
             self.lc_direction = None
             self.dy = 0.0
     
-    def move(self, dt: float):
-        """Move vehicle for time step dt - equivalent to Java move() method"""
-        if self.state.crashed:
+    def move(self, dt: float, half_dt2: Optional[float] = None):
+        """Move vehicle for time step dt - equivalent to Java move() method
+
+        half_dt2 is 0.5*dt*dt; the model hoists it out of its move loop
+        so the constant is not recomputed per vehicle. It is derived
+        locally when omitted.
+
+        Vehicle observers are notified by the model after the move
+        phase, not from here - iterating the (usually empty) observer
+        list per vehicle per step added up to millions of no-op loops.
+        """
+        state = self.state
+        if state.crashed:
             return
-        
-        # Store acceleration for debugging
-        current_time = time.time()
-        self.accelerations[current_time] = self.state.acceleration
-        
+        if half_dt2 is None:
+            half_dt2 = 0.5 * dt * dt
+
+        # Store acceleration for debugging (opt-in)
+        if Vehicle.DEBUG_TRACE:
+            self.accelerations[time.time()] = state.acceleration
+
         # Lateral movement (lane changing)
-        if self.dy != 0:
-            self.state.lane_change_progress += self.dy * dt
-            if self.state.lane_change_progress >= 1.0:
+        changing = self._changing
+        if changing:
+            state.lane_change_progress += self.dy * dt
+            if state.lane_change_progress >= 1.0:
                 self.end_lane_change()
-        
-        # Longitudinal movement
-        dx = dt * self.state.velocity + 0.5 * self.state.acceleration * dt * dt
-        dx = max(0.0, dx)  # Ensure non-negative movement
-        
-        # Update velocity
-        self.state.velocity += dt * self.state.acceleration
-        self.state.velocity = max(0.0, self.state.velocity)  # Ensure non-negative velocity
-        
+                changing = False
+
+        # Longitudinal movement (non-negative)
+        dx = dt * state.velocity + half_dt2 * state.acceleration
+        if dx < 0.0:
+            dx = 0.0
+
+        # Update velocity (non-negative)
+        velocity = state.velocity + dt * state.acceleration
+        state.velocity = velocity if velocity > 0.0 else 0.0
+
         # Update position
-        self.state.x += dx
-        self.state.y += self.dy * dt if self.is_changing_lane() else 0.0
-        
-        # Notify observers
-        for observer in self.observers:
-            observer.observe_vehicle_move(self)
+        state.x += dx
+        if changing:
+            state.y += self.dy * dt
     
     def set_acceleration(self, acceleration: float):
         """Set vehicle acceleration"""
@@ -226,6 +271,7 @@ class Vehicle(VehicleInterface):
         self.state.crashed = True
         self.state.velocity = 0.0
         self.state.acceleration = 0.0
+        self._changing = False
     
     def add_observer(self, observer: 'Observer'):
         """Add observer for vehicle state changes"""
@@ -237,8 +283,33 @@ class Vehicle(VehicleInterface):
         if observer in self.observers:
             self.observers.remove(observer)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert vehicle to dictionary for JSON serialization"""
+    # Field name -> getter, for projected serialization; keys match the
+    # full to_dict payload
+    _FIELD_GETTERS = {
+        'id': lambda v: v.id,
+        'x': lambda v: v.state.x,
+        'y': lambda v: v.state.y,
+        'velocity': lambda v: v.state.velocity,
+        'acceleration': lambda v: v.state.acceleration,
+        'lane_id': lambda v: v.lane.id if v.lane else None,
+        'length': lambda v: v.length,
+        'width': lambda v: v.width,
+        'is_changing_lane': lambda v: v._changing,
+        'lane_change_progress': lambda v: v.state.lane_change_progress,
+        'lane_change_direction': lambda v: v.lc_direction.value if v.lc_direction else None,
+        'crashed': lambda v: v.state.crashed,
+    }
+
+    def to_dict(self, fields: Optional[tuple] = None) -> Dict[str, Any]:
+        """Convert vehicle to dictionary for JSON serialization
+
+        fields selects a projection (e.g. ('id', 'x', 'y')) so callers
+        that only need a few columns do not pay for the full 12-key
+        payload; None keeps the complete dict.
+        """
+        if fields is not None:
+            getters = self._FIELD_GETTERS
+            return {name: getters[name](self) for name in fields}
         return {
             'id': self.id,
             'x': self.state.x,
@@ -262,10 +333,9 @@ class Vehicle(VehicleInterface):
 
 
 # Observer interface for vehicle monitoring
-class Observer(ABC):
+class Observer(Protocol):
     """Observer interface for monitoring vehicle changes"""
-    
-    @abstractmethod
+
     def observe_vehicle_move(self, vehicle: Vehicle):
         """Called when vehicle moves"""
-        pass
\ No newline at end of file
+        ...
\ No newline at end of file
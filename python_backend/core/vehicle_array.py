@@ -0,0 +1,116 @@
+"""
+Struct-of-arrays scratch buffers for batch vehicle integration
+NumPy is an optional accelerator (see kernels.py): the model only
+constructs a VehicleArray when numpy is importable, and the per-object
+scalar path keeps working without it
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy not installed
+    np = None
+
+HAVE_NUMPY = np is not None
+
+# Canonical dtype of the batched vehicle state: the column set, field
+# order and per-field precision live in this one declaration. The
+# buffers below are still allocated one array per field (SoA) rather
+# than as a single record array, because the kernels want contiguous
+# columns; snapshot() produces the row-wise (AoS) view on demand.
+#
+# The kinematic step is memory-bound, so the bounded columns are
+# float32 - halving their bytes halves the bandwidth they move, and
+# velocity/acceleration/lateral state are feedback-corrected every tick
+# so f4 resolution is well inside the model's accuracy. x stays f8: it
+# is the one unbounded accumulator, and rounding it through f4 on every
+# gather/scatter round trip drifts metres over long runs. progress
+# stays a float (not a quantized u1) so the >= 1.0 completion test
+# keeps its exact semantics.
+VEHICLE_DTYPE = np.dtype([
+    ('x', 'f8'), ('y', 'f4'),
+    ('velocity', 'f4'), ('acceleration', 'f4'),
+    ('dy', 'f4'), ('progress', 'f4'),
+    ('crashed', '?'),
+]) if HAVE_NUMPY else None
+
+
+class VehicleArray:
+    """Reusable struct-of-arrays view of the fleet for batch kernels
+
+    Holds one parallel column per kinematic field. gather() copies the
+    per-vehicle state into the columns and remembers the row-aligned
+    vehicle list; after a kernel has integrated the columns in place,
+    scatter() writes the results back into the Vehicle objects. The
+    buffers grow geometrically and are reused across ticks, so at steady
+    state a gather/scatter round trip allocates nothing.
+    """
+
+    def __init__(self, capacity: int = 0):
+        self.n = 0
+        self.vehicles: list = []
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        for name, (dtype, _) in VEHICLE_DTYPE.fields.items():
+            setattr(self, name, np.empty(capacity, dtype))
+
+    def gather(self, vehicles) -> list:
+        """Fill the columns from the given vehicles
+
+        Returns the row-aligned vehicle list; row i of every column
+        belongs to the i-th returned vehicle.
+        """
+        refs = self.vehicles
+        refs.clear()
+        refs.extend(vehicles)
+        n = len(refs)
+        if n > self.capacity:
+            self._allocate(max(n, 2 * self.capacity))
+        x = self.x
+        y = self.y
+        velocity = self.velocity
+        acceleration = self.acceleration
+        dy = self.dy
+        progress = self.progress
+        crashed = self.crashed
+        for i, vehicle in enumerate(refs):
+            state = vehicle.state
+            x[i] = state.x
+            y[i] = state.y
+            velocity[i] = state.velocity
+            acceleration[i] = state.acceleration
+            dy[i] = vehicle.dy
+            progress[i] = state.lane_change_progress
+            crashed[i] = state.crashed
+        self.n = n
+        return refs
+
+    def scatter(self):
+        """Write the integrated columns back into the vehicle states
+
+        Columns are converted with tolist() so the states hold plain
+        Python floats again (numpy scalars are not JSON-serializable by
+        the stdlib encoder used in simple_server.py).
+        """
+        n = self.n
+        x = self.x[:n].tolist()
+        y = self.y[:n].tolist()
+        velocity = self.velocity[:n].tolist()
+        progress = self.progress[:n].tolist()
+        for i, vehicle in enumerate(self.vehicles):
+            state = vehicle.state
+            state.x = x[i]
+            state.y = y[i]
+            state.velocity = velocity[i]
+            state.lane_change_progress = progress[i]
+
+    def snapshot(self) -> 'np.ndarray':
+        """Copy the live rows into one structured VEHICLE_DTYPE array
+
+        Row-wise (AoS) export for analysis or bulk serialization; the
+        hot path keeps operating on the per-field columns.
+        """
+        out = np.empty(self.n, VEHICLE_DTYPE)
+        for name in VEHICLE_DTYPE.names:
+            out[name] = getattr(self, name)[:self.n]
+        return out
@@ -8,9 +8,24 @@ import os
 import json
 import threading
 import time
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 
+# Optional accelerator: orjson serializes straight to bytes several
+# times faster than the stdlib encoder. The server stays dependency-free
+# without it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_json(data) -> bytes:
+    """Encode a payload straight to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -21,7 +36,18 @@ from python_backend.core.driver import DriverType, Route
 
 class TrafficSimHandler(SimpleHTTPRequestHandler):
     """Simple HTTP handler for the traffic simulation"""
-    
+
+    # Per-tick snapshot cache for the read endpoints, shared by all
+    # handler threads: concurrent polls within one simulation tick are
+    # served from memory instead of re-walking the model
+    _snapshot_cache: dict = {}
+    _cache_lock = threading.Lock()
+
+    # Simulation model, bound once in main() so request handlers read a
+    # class attribute instead of resolving the singleton per request
+    # (get_instance stays the entry point for embedded use)
+    model = None
+
     def __init__(self, *args, **kwargs):
         # Dynamically resolve the path to the 'frontend' directory
         frontend_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend')
@@ -64,23 +90,50 @@ class TrafficSimHandler(SimpleHTTPRequestHandler):
     
     def handle_api_get(self, path):
         """Handle API GET requests"""
-        model = TrafficSimulationModel.get_instance()
+        model = self.model or TrafficSimulationModel.get_instance()
         
         if path == '/api/status':
-            data = model.get_simulation_data()
-            self.send_json_response(data)
+            self.send_json_response(
+                self._cached_snapshot('status', model,
+                                      model.get_simulation_data))
         elif path == '/api/vehicles':
-            vehicles = [v.to_dict() for v in model.get_vehicles()]
-            self.send_json_response({'vehicles': vehicles})
+            # Column-wise payload (one list per field) like the
+            # websocket API: no per-vehicle dict churn
+            self.send_json_response(
+                self._cached_snapshot(
+                    'vehicles', model,
+                    lambda: {'vehicles': model.get_vehicle_columns()}))
         elif path == '/api/lanes':
-            lanes = [l.to_dict() for l in model.get_lanes()]
-            self.send_json_response({'lanes': lanes})
+            self.send_json_response(
+                self._cached_snapshot(
+                    'lanes', model,
+                    lambda: {'lanes': [l.to_dict() for l in model.get_lanes()]}))
         else:
             self.send_error(404)
+
+    def _cached_snapshot(self, key, model, build) -> bytes:
+        """Build and encode an API payload at most once per model version
+
+        model.tick_count serves as the version token: it is bumped on
+        every tick and on every state transition (start/pause/resume/
+        stop, vehicle add/remove, clear), so while nothing has changed,
+        repeated polls of the same endpoint return the cached encoded
+        bytes, and the model walk plus JSON encode happen once per
+        version per endpoint.
+        """
+        tick = model.tick_count
+        with self._cache_lock:
+            cached = self._snapshot_cache.get(key)
+            if cached is not None and cached[0] == tick:
+                return cached[1]
+        payload = _encode_json(build())
+        with self._cache_lock:
+            self._snapshot_cache[key] = (tick, payload)
+        return payload
     
     def handle_api_post(self, path):
         """Handle API POST requests"""
-        model = TrafficSimulationModel.get_instance()
+        model = self.model or TrafficSimulationModel.get_instance()
         
         try:
             content_length = int(self.headers.get('Content-Length', 0))
@@ -100,8 +153,7 @@ class TrafficSimHandler(SimpleHTTPRequestHandler):
                 model.stop_simulation()
                 self.send_json_response({'status': 'success', 'message': 'Simulation stopped'})
             elif path == '/api/reset':
-                model.stop_simulation()
-                TrafficSimulationModel.reset_instance()
+                model.clear()
                 self.send_json_response({'status': 'success', 'message': 'Simulation reset'})
             elif path == '/api/step':
                 model.step_simulation()
@@ -119,7 +171,7 @@ class TrafficSimHandler(SimpleHTTPRequestHandler):
     
     def load_simple_scenario(self):
         """Load a simple 3-lane highway scenario"""
-        model = TrafficSimulationModel.get_instance()
+        model = self.model or TrafficSimulationModel.get_instance()
         
         # Create lanes
         lane1 = Lane(0, LaneType.NORMAL, 2000.0, [Coordinate(0, 0), Coordinate(2000, 0)])
@@ -150,11 +202,11 @@ class TrafficSimHandler(SimpleHTTPRequestHandler):
     
     def add_vehicle(self, data):
         """Add a vehicle to the simulation"""
-        model = TrafficSimulationModel.get_instance()
+        model = self.model or TrafficSimulationModel.get_instance()
         
         lane_id = data.get('lane_id', 0)
         position = data.get('position', 0.0)
-        driver_type = DriverType(data.get('driver_type', 'IDM'))
+        driver_type = DriverType.coerce(data.get('driver_type', 'IDM'))
         
         vehicle = model.add_vehicle(lane_id, driver_type, position)
         
@@ -168,16 +220,22 @@ class TrafficSimHandler(SimpleHTTPRequestHandler):
             self.send_json_response({'status': 'error', 'message': 'Failed to add vehicle'}, 400)
     
     def send_json_response(self, data, status_code=200):
-        """Send a JSON response"""
-        json_data = json.dumps(data)
-        
+        """Send a JSON response
+
+        data may already be encoded bytes (the per-tick snapshot cache
+        stores those), in which case it is written as-is with no
+        intermediate str/encode round trip.
+        """
+        payload = data if isinstance(data, bytes) else _encode_json(data)
+
         self.send_response(status_code)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
-        self.wfile.write(json_data.encode())
+        self.wfile.write(payload)
     
     def do_OPTIONS(self):
         """Handle OPTIONS requests for CORS"""
@@ -194,9 +252,15 @@ def main():
     
     print(f"Starting Traffic Simulation Server on port {port}")
     print(f"Visit http://localhost:{port} to access the simulation")
-    
+
+    # Resolve the singleton once for all request handlers
+    TrafficSimHandler.model = TrafficSimulationModel.get_instance()
+
+
     try:
-        with HTTPServer(('localhost', port), TrafficSimHandler) as httpd:
+        # Threaded server: a slow snapshot for one client no longer
+        # blocks every other request
+        with ThreadingHTTPServer(('localhost', port), TrafficSimHandler) as httpd:
             httpd.serve_forever()
     except KeyboardInterrupt:
         print("\nServer stopped")